@@ -106,6 +106,7 @@ async def run_agent_turn(user_input: str) -> list[AgentEvent]:
     events: list[AgentEvent] = []
     async for event in agent.run_turn(user_input):
         events.append(event)
+    await agent.aclose()
 
     return events
 
@@ -216,6 +217,7 @@ def render_chat_tab() -> None:
                                 sig = tool_calls[-1]["sig"] if tool_calls else event.tool_name
                                 current_tool_placeholder.markdown(f"`{sig}`")
                                 current_tool_placeholder = None
+                    await agent.aclose()
 
                     # Clear the cursor
                     if response_text:
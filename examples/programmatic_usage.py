@@ -109,6 +109,7 @@ async def run_agent_with_tools(
             print(f"\n\n[{usage.get('total_input_tokens', 0)} in, {usage.get('total_output_tokens', 0)} out]")
             print(f"[{len(tool_calls)} tool calls: {', '.join(tool_calls)}]")
 
+    await agent.aclose()
     return response_text
 
 
@@ -143,6 +144,7 @@ Here is context to work with:
         if event.type == "text" and event.content:
             response += event.content
 
+    await agent.aclose()
     return response
 
 
@@ -1,56 +1,68 @@
 """CLI entry point for ro-agent."""
 
+from __future__ import annotations
+
 import asyncio
+import functools
 import os
 import platform
-import re
 import signal
+import sys
 import uuid
+from collections.abc import Callable
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Annotated, Any, Iterable, Optional
+from typing import TYPE_CHECKING, Annotated, Any, Optional
 
 import typer
-import yaml
 from dotenv import load_dotenv
 
 # Load .env before anything else so env vars are available for defaults
 load_dotenv()
-from prompt_toolkit import PromptSession
-from prompt_toolkit.completion import (
-    Completer,
-    Completion,
-    WordCompleter,
-    merge_completers,
-)
-from prompt_toolkit.document import Document
-from prompt_toolkit.formatted_text import HTML
-from prompt_toolkit.history import FileHistory
-from prompt_toolkit.key_binding import KeyBindings
 from rich.console import Console
-from rich.panel import Panel
 
-from .client.model import ModelClient
-from .core.agent import Agent, AgentEvent
 from .core.conversations import ConversationStore
-from .core.session import Session
-from .prompts import load_prompt, parse_vars, prepare_prompt
-from .capabilities import CapabilityProfile, ShellMode, FileWriteMode
-from .capabilities.factory import ToolFactory, load_profile
-from .tools.registry import ToolRegistry
-from .observability.config import ObservabilityConfig, DEFAULT_TELEMETRY_DB
-from .observability.processor import ObservabilityProcessor, create_processor
-from .observability.context import TelemetryContext
 from .signals import AgentInfo, SignalManager
 
+# The agent stack (openai client, tools, prompts, observability) is imported
+# where it is first needed, so --help, --list, ps and kill start quickly.
+if TYPE_CHECKING:
+    from prompt_toolkit.completion import Completer
+
+    from .capabilities import CapabilityProfile
+    from .core.agent import Agent, AgentEvent
+    from .core.session import Session
+    from .observability.processor import ObservabilityProcessor
+    from .tools.registry import ToolRegistry
+
+# Host platform, resolved once (signal handlers are installed per turn)
+PLATFORM = platform.system()
+IS_WINDOWS = PLATFORM == "Windows"
+
 # Config directory for ro-agent data
 CONFIG_DIR = Path.home() / ".config" / "ro-agent"
 HISTORY_FILE = CONFIG_DIR / "history"
 DEFAULT_PROMPT_FILE = CONFIG_DIR / "default.md"
 
+
+@functools.cache
+def _ensure_config_dir() -> Path:
+    """Create the config directory once per process."""
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    return CONFIG_DIR
+
+
 # Built-in default prompt (ships with package)
 BUILTIN_PROMPT_FILE = Path(__file__).parent / "prompts" / "default.md"
 
+# Model used when neither --model nor OPENAI_MODEL is given
+DEFAULT_MODEL = "gpt-5-mini"
+
+# ANSI styles for lines written directly to stdout
+ANSI_CYAN = "\x1b[36m"
+ANSI_DIM = "\x1b[2m"
+ANSI_RESET = "\x1b[0m"
+
 # Tool output preview lines (0 to disable)
 TOOL_PREVIEW_LINES = int(os.getenv("RO_AGENT_PREVIEW_LINES", "6"))
 
@@ -97,96 +109,32 @@ Always use absolute paths in tool calls.
 # Commands the user can type during the session
 COMMANDS = ["/approve", "/compact", "/help", "/clear", "exit", "quit"]
 
-# Pattern to detect path-like strings in text
-PATH_PATTERN = re.compile(
-    r"(~/?|\.{1,2}/|/)?([a-zA-Z0-9_\-./]+/[a-zA-Z0-9_\-.]*|~[a-zA-Z0-9_\-./]*)$"
-)
-
-
-class InlinePathCompleter(Completer):
-    """Completes file paths that appear anywhere in the input text."""
-
-    def __init__(self, working_dir: str | None = None) -> None:
-        self.working_dir = Path(working_dir).expanduser() if working_dir else Path.cwd()
-
-    def get_completions(
-        self, document: Document, complete_event: Any
-    ) -> Iterable[Completion]:
-        text_before_cursor = document.text_before_cursor
-
-        match = PATH_PATTERN.search(text_before_cursor)
-        if not match:
-            return
-
-        path_text = match.group(0)
-        start_pos = -len(path_text)
-
-        # Expand paths for lookup
-        if path_text.startswith("~"):
-            expanded = os.path.expanduser(path_text)
-        elif path_text.startswith("/"):
-            expanded = path_text
-        else:
-            expanded = str(self.working_dir / path_text)
-
-        path = Path(expanded)
-        if expanded.endswith("/"):
-            parent = path
-            prefix = ""
-        else:
-            parent = path.parent
-            prefix = path.name
-
-        try:
-            if not parent.exists():
-                return
-
-            for entry in sorted(parent.iterdir()):
-                name = entry.name
-                if not name.startswith(prefix):
-                    continue
-                if name.startswith(".") and not prefix.startswith("."):
-                    continue
-
-                # Build completion text preserving user's path style
-                if path_text.startswith("~"):
-                    if expanded.endswith("/"):
-                        completion_text = path_text + name
-                    else:
-                        completion_text = (
-                            path_text.rsplit("/", 1)[0] + "/" + name
-                            if "/" in path_text
-                            else "~/" + name
-                        )
-                else:
-                    if expanded.endswith("/"):
-                        completion_text = path_text + name
-                    else:
-                        completion_text = (
-                            str(path.parent / name) if "/" in path_text else name
-                        )
-
-                display = name + "/" if entry.is_dir() else name
-                if entry.is_dir():
-                    completion_text += "/"
-
-                yield Completion(
-                    completion_text,
-                    start_position=start_pos,
-                    display=display,
-                    display_meta="dir" if entry.is_dir() else "",
-                )
-        except PermissionError:
-            return
-
-
 def create_completer(working_dir: str | None = None) -> Completer:
     """Create a merged completer for commands and paths."""
+    from prompt_toolkit.completion import WordCompleter, merge_completers
+
+    from .completion import InlinePathCompleter
+
     command_completer = WordCompleter(COMMANDS, ignore_case=True)
     path_completer = InlinePathCompleter(working_dir=working_dir)
     return merge_completers([command_completer, path_completer])
 
 
+def _default_prompt_vars(
+    working_dir: str, profile: CapabilityProfile
+) -> dict[str, str]:
+    """Variables available to the default system prompts."""
+    return {
+        "platform": PLATFORM,
+        "home_dir": str(Path.home()),
+        "working_dir": working_dir,
+        "profile_name": profile.name,
+        "shell_mode": profile.shell.value,
+        "file_write_mode": profile.file_write.value,
+        "database_mode": profile.database.value,
+    }
+
+
 def create_registry(
     working_dir: str | None = None,
     profile: CapabilityProfile | None = None,
@@ -200,6 +148,9 @@ def create_registry(
     Returns:
         Configured tool registry.
     """
+    from .capabilities import CapabilityProfile
+    from .capabilities.factory import ToolFactory
+
     if profile is None:
         profile = CapabilityProfile.readonly()
 
@@ -225,8 +176,9 @@ class ApprovalHandler:
 
         console.print("[yellow]Approve? \\[Y/n]:[/yellow] ", end="")
 
+        # Read in a worker thread so the event loop keeps running while we wait
         try:
-            response = input().strip().lower()
+            response = (await asyncio.to_thread(input)).strip().lower()
         except (EOFError, KeyboardInterrupt):
             return False
 
@@ -234,24 +186,94 @@ class ApprovalHandler:
         return response not in ("n", "no")
 
 
+def _format_bash_args(tool_args: dict[str, Any]) -> str | None:
+    """Show just the command for bash calls."""
+    return tool_args.get("command")
+
+
+def _format_generic_args(tool_args: dict[str, Any]) -> str:
+    """Show all args (no truncation), quoting string values."""
+    return ", ".join(
+        f"{key}='{val}'" if isinstance(val, str) else f"{key}={val}"
+        for key, val in tool_args.items()
+    )
+
+
+# Per-tool argument formatters; None falls back to the generic format
+SIGNATURE_FORMATTERS: dict[str, Callable[[dict[str, Any]], str | None]] = {
+    "bash": _format_bash_args,
+}
+
+
 def _format_tool_signature(tool_name: str, tool_args: dict[str, Any] | None) -> str:
     """Format tool call as a signature like: read(path='/foo/bar.py')"""
     if not tool_args:
         return f"{tool_name}()"
 
-    # For bash commands, show just the command
-    if tool_name == "bash" and "command" in tool_args:
-        return f"{tool_name}({tool_args['command']})"
+    formatter = SIGNATURE_FORMATTERS.get(tool_name)
+    formatted = formatter(tool_args) if formatter else None
+    if formatted is None:
+        formatted = _format_generic_args(tool_args)
+    return f"{tool_name}({formatted})"
+
+
+def _summarize_grep(metadata: dict[str, Any]) -> str | None:
+    matches = metadata.get("matches", 0)
+    if matches:
+        suffix = "+" if metadata.get("truncated", False) else ""
+        return f"{matches}{suffix} matches"
+    return "No matches"
+
+
+def _summarize_read(metadata: dict[str, Any]) -> str | None:
+    get = metadata.get
+    total = get("total_lines", 0)
+    if total:
+        return f"Read lines {get('start_line', 1)}-{get('end_line', total)} of {total}"
+    return None
+
+
+def _summarize_list(metadata: dict[str, Any]) -> str | None:
+    count = metadata.get("item_count", 0)
+    return f"{count} items" if count else None
+
+
+def _summarize_write(metadata: dict[str, Any]) -> str | None:
+    size = metadata.get("size_bytes", 0)
+    if size:
+        return f"Wrote {size} bytes ({metadata.get('lines', 0)} lines)"
+    return None
+
+
+def _summarize_glob(metadata: dict[str, Any]) -> str | None:
+    matches = metadata.get("matches", 0)
+    if matches:
+        total = metadata.get("total", matches)
+        if total > matches:
+            return f"{matches} of {total} files"
+        return f"{matches} files"
+    return "No files found"
+
+
+def _summarize_database(metadata: dict[str, Any]) -> str | None:
+    get = metadata.get
+    rows = get("row_count", get("table_count", 0))
+    return f"{rows} rows" if rows else None
 
-    # For other tools, show all args (no truncation)
-    parts = []
-    for key, val in tool_args.items():
-        if isinstance(val, str):
-            parts.append(f"{key}='{val}'")
-        else:
-            parts.append(f"{key}={val}")
 
-    return f"{tool_name}({', '.join(parts)})"
+# Metadata-based summaries per tool; None falls back to a line count
+SUMMARY_FORMATTERS: dict[str, Callable[[dict[str, Any]], str | None]] = {
+    "grep": _summarize_grep,
+    "read": _summarize_read,
+    "list": _summarize_list,
+    "write": _summarize_write,
+    "glob": _summarize_glob,
+    "oracle": _summarize_database,
+    "sqlite": _summarize_database,
+    "vertica": _summarize_database,
+    "mysql": _summarize_database,
+    "postgres": _summarize_database,
+}
 
 
 def _format_tool_summary(
@@ -265,51 +287,11 @@ def _format_tool_summary(
 
     # Use metadata if available
     if metadata:
-        # grep tool
-        if tool_name == "grep":
-            matches = metadata.get("matches", 0)
-            truncated = metadata.get("truncated", False)
-            if matches:
-                suffix = "+" if truncated else ""
-                return f"{matches}{suffix} matches"
-            return "No matches"
-
-        # read tool
-        if tool_name == "read":
-            total = metadata.get("total_lines", 0)
-            start = metadata.get("start_line", 1)
-            end = metadata.get("end_line", total)
-            if total:
-                return f"Read lines {start}-{end} of {total}"
-
-        # list tool
-        if tool_name == "list":
-            count = metadata.get("item_count", 0)
-            if count:
-                return f"{count} items"
-
-        # write tool
-        if tool_name == "write":
-            size = metadata.get("size_bytes", 0)
-            lines = metadata.get("lines", 0)
-            if size:
-                return f"Wrote {size} bytes ({lines} lines)"
-
-        # glob tool
-        if tool_name == "glob":
-            matches = metadata.get("matches", 0)
-            total = metadata.get("total", matches)
-            if matches:
-                if total > matches:
-                    return f"{matches} of {total} files"
-                return f"{matches} files"
-            return "No files found"
-
-        # Database tools
-        if tool_name in ("oracle", "sqlite", "vertica", "mysql", "postgres"):
-            rows = metadata.get("row_count", metadata.get("table_count", 0))
-            if rows:
-                return f"{rows} rows"
+        formatter = SUMMARY_FORMATTERS.get(tool_name)
+        if formatter:
+            summary = formatter(metadata)
+            if summary:
+                return summary
 
     # Fallback: count lines in result
     if result:
@@ -330,72 +312,165 @@ def _format_tool_preview(
     if not result or max_lines <= 0:
         return None
 
-    lines = result.split("\n")
-    if len(lines) <= max_lines:
-        return result
+    # Find the end of the last previewed line without splitting the whole output
+    end = -1
+    for _ in range(max_lines):
+        end = result.find("\n", end + 1)
+        if end == -1:
+            return result
+
+    remaining = result.count("\n", end)
+    return f"{result[:end]}\n... ({remaining} more lines)"
+
+
+def _write_styled(text: str, ansi: str) -> None:
+    """Write a line of plain text in one ANSI style, bypassing Rich.
+
+    Used for per-tool lines where Rich's markup and layout passes buy
+    nothing. Falls back to unstyled text when Rich has colour disabled
+    (not a terminal, NO_COLOR, dumb terminal).
+    """
+    if console.color_system:
+        sys.stdout.write(f"{ansi}{text}{ANSI_RESET}\n")
+    else:
+        sys.stdout.write(f"{text}\n")
+    sys.stdout.flush()
+
+
+def _on_tool_start(event: AgentEvent) -> None:
+    # Show compact tool signature (like Claude Code)
+    _write_styled(_format_tool_signature(event.tool_name, event.tool_args), ANSI_CYAN)
+
+
+def _on_tool_end(event: AgentEvent) -> None:
+    # Show a brief summary of what the tool found
+    summary = _format_tool_summary(
+        event.tool_name, event.tool_metadata, event.tool_result
+    )
+    if summary:
+        console.print(f"[dim]  → {summary}[/dim]")
+
+    # Show preview of the actual output
+    preview = _format_tool_preview(event.tool_result)
+    if preview:
+        # Indent each line for visual grouping
+        indented = "    " + preview.replace("\n", "\n    ")
+        _write_styled(indented, ANSI_DIM)
+
+    # Rendering is the last use of the output here (telemetry captures it
+    # before the event is yielded), so don't keep it alive via the event
+    event.tool_result = None
+
+
+def _on_tool_blocked(event: AgentEvent) -> None:
+    console.print("[red]Command rejected[/red]")
+
 
-    preview_lines = lines[:max_lines]
-    remaining = len(lines) - max_lines
-    preview_lines.append(f"... ({remaining} more lines)")
-    return "\n".join(preview_lines)
+def _on_compact_start(event: AgentEvent) -> None:
+    trigger = event.content or "manual"
+    if trigger == "auto":
+        console.print(
+            "[yellow]Context limit approaching, auto-compacting...[/yellow]"
+        )
+    else:
+        console.print("[yellow]Compacting conversation...[/yellow]")
+
+
+def _on_compact_end(event: AgentEvent) -> None:
+    console.print(f"[green]{event.content}[/green]")
+    console.print(
+        "[dim]Note: Multiple compactions can reduce accuracy. "
+        "Start a new session when possible.[/dim]"
+    )
+
+
+def _on_turn_complete(event: AgentEvent) -> None:
+    # Ensure we end on a new line
+    print()
+    usage = event.usage or {}
+    console.print(
+        f"[dim][{usage.get('total_input_tokens', 0)} in, "
+        f"{usage.get('total_output_tokens', 0)} out][/dim]"
+    )
+
+
+def _on_error(event: AgentEvent) -> None:
+    console.print(f"[red]Error: {event.content}[/red]")
+
+
+# Console renderers for non-text agent events, keyed by event type
+EVENT_HANDLERS: dict[str, Callable[[AgentEvent], None]] = {
+    "tool_start": _on_tool_start,
+    "tool_end": _on_tool_end,
+    "tool_blocked": _on_tool_blocked,
+    "compact_start": _on_compact_start,
+    "compact_end": _on_compact_end,
+    "turn_complete": _on_turn_complete,
+    "error": _on_error,
+}
 
 
 def handle_event(event: AgentEvent) -> None:
     """Handle an agent event by printing to console."""
     if event.type == "text":
-        # Stream text immediately as it arrives
+        # Stream text immediately as it arrives (by far the most common event)
         print(event.content or "", end="", flush=True)
+        return
 
-    elif event.type == "tool_start":
-        # Show compact tool signature (like Claude Code)
-        sig = _format_tool_signature(event.tool_name, event.tool_args)
-        console.print(f"[cyan]{sig}[/cyan]")
+    handler = EVENT_HANDLERS.get(event.type)
+    if handler is not None:
+        handler(event)
 
-    elif event.type == "tool_end":
-        # Show a brief summary of what the tool found
-        summary = _format_tool_summary(
-            event.tool_name, event.tool_metadata, event.tool_result
-        )
-        if summary:
-            console.print(f"[dim]  → {summary}[/dim]")
-
-        # Show preview of the actual output
-        preview = _format_tool_preview(event.tool_result)
-        if preview:
-            # Indent each line for visual grouping
-            indented = "\n".join(f"    {line}" for line in preview.split("\n"))
-            console.print(f"[dim]{indented}[/dim]")
-
-    elif event.type == "tool_blocked":
-        console.print("[red]Command rejected[/red]")
-
-    elif event.type == "compact_start":
-        trigger = event.content or "manual"
-        if trigger == "auto":
-            console.print(
-                "[yellow]Context limit approaching, auto-compacting...[/yellow]"
-            )
-        else:
-            console.print("[yellow]Compacting conversation...[/yellow]")
 
-    elif event.type == "compact_end":
-        console.print(f"[green]{event.content}[/green]")
-        console.print(
-            "[dim]Note: Multiple compactions can reduce accuracy. "
-            "Start a new session when possible.[/dim]"
-        )
+def _cmd_approve(args: str, approval_handler: ApprovalHandler) -> str | None:
+    approval_handler.enable_auto_approve()
+    return None
 
-    elif event.type == "turn_complete":
-        # Ensure we end on a new line
-        print()
-        usage = event.usage or {}
-        console.print(
-            f"[dim][{usage.get('total_input_tokens', 0)} in, "
-            f"{usage.get('total_output_tokens', 0)} out][/dim]"
+
+def _cmd_compact(args: str, approval_handler: ApprovalHandler) -> str | None:
+    # Pass through optional instructions after /compact
+    if args:
+        return f"compact:{args}"
+    return "compact"
+
+
+def _cmd_help(args: str, approval_handler: ApprovalHandler) -> str | None:
+    from rich.panel import Panel
+
+    console.print(
+        Panel(
+            "[bold]Commands:[/bold]\n"
+            "  /approve             - Enable auto-approve for all tool calls\n"
+            "  /compact [guidance]  - Compact conversation history\n"
+            "  /help                - Show this help\n"
+            "  /clear               - Clear the screen\n"
+            "  exit                 - Quit the session\n"
+            "\n[bold]Input:[/bold]\n"
+            "  Enter               - Send message\n"
+            "  Esc+Enter           - New line\n"
+            "\n[bold]Conversations:[/bold]\n"
+            "  ro-agent --list     - List saved conversations\n"
+            "  ro-agent -r latest  - Resume most recent conversation\n"
+            "  ro-agent -r <id>    - Resume specific conversation",
+            title="Help",
+            border_style="blue",
         )
+    )
+    return None
+
 
-    elif event.type == "error":
-        console.print(f"[red]Error: {event.content}[/red]")
+def _cmd_clear(args: str, approval_handler: ApprovalHandler) -> str | None:
+    console.clear()
+    return None
+
+
+# Slash command handlers keyed by command name
+COMMAND_HANDLERS: dict[str, Callable[[str, ApprovalHandler], str | None]] = {
+    "/approve": _cmd_approve,
+    "/compact": _cmd_compact,
+    "/help": _cmd_help,
+    "/clear": _cmd_clear,
+}
 
 
 def handle_command(
@@ -409,44 +484,11 @@ def handle_command(
         "compact" or "compact:<instructions>" if /compact was called
         Other string values for future special handling
     """
-    if cmd == "/approve":
-        approval_handler.enable_auto_approve()
-        return None
-
-    if cmd.startswith("/compact"):
-        # Extract optional instructions after /compact
-        parts = cmd.split(maxsplit=1)
-        if len(parts) > 1:
-            return f"compact:{parts[1]}"
-        return "compact"
-
-    if cmd == "/help":
-        console.print(
-            Panel(
-                "[bold]Commands:[/bold]\n"
-                "  /approve             - Enable auto-approve for all tool calls\n"
-                "  /compact [guidance]  - Compact conversation history\n"
-                "  /help                - Show this help\n"
-                "  /clear               - Clear the screen\n"
-                "  exit                 - Quit the session\n"
-                "\n[bold]Input:[/bold]\n"
-                "  Enter               - Send message\n"
-                "  Esc+Enter           - New line\n"
-                "\n[bold]Conversations:[/bold]\n"
-                "  ro-agent --list     - List saved conversations\n"
-                "  ro-agent -r latest  - Resume most recent conversation\n"
-                "  ro-agent -r <id>    - Resume specific conversation",
-                title="Help",
-                border_style="blue",
-            )
-        )
-        return None
-
-    if cmd == "/clear":
-        console.clear()
+    parts = cmd.split(maxsplit=1)
+    handler = COMMAND_HANDLERS.get(parts[0]) if parts else None
+    if handler is None:
         return None
-
-    return None
+    return handler(parts[1] if len(parts) > 1 else "", approval_handler)
 
 
 async def run_interactive(
@@ -463,8 +505,19 @@ async def run_interactive(
     session_id: str | None = None,
 ) -> None:
     """Run an interactive REPL session."""
-    # Ensure config directory exists
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    # prompt_toolkit is only needed for the REPL; keep it off the import
+    # path for single-prompt and listing commands
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.formatted_text import HTML
+    from prompt_toolkit.history import FileHistory
+    from prompt_toolkit.key_binding import KeyBindings
+    from rich.panel import Panel
+
+    from .completion import warm_dir_cache
+    from .core.agent import AgentEvent
+
+    # Ensure config directory exists (off the loop; home may be a network mount)
+    await asyncio.to_thread(_ensure_config_dir)
 
     # Start observability session if enabled
     if observability:
@@ -487,7 +540,14 @@ async def run_interactive(
         multiline=True,
         key_bindings=key_bindings,
         complete_while_typing=False,
-        complete_in_thread=True,
+    )
+
+    # List likely completion roots on the completer thread so the first
+    # path completion doesn't pay for a cold directory read
+    warm_task = warm_dir_cache(
+        working_dir,
+        os.path.dirname(working_dir),
+        str(Path.home()),
     )
 
     # Welcome message
@@ -540,14 +600,14 @@ async def run_interactive(
                 continue
 
             # Run the turn and handle events with cancellation support
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
 
             def on_cancel():
                 console.print("\n[yellow]Cancelling...[/yellow]")
                 agent.request_cancel()
 
             # Register signal handler for this turn (Unix only)
-            if platform.system() != "Windows":
+            if not IS_WINDOWS:
                 loop.add_signal_handler(signal.SIGINT, on_cancel)
 
             try:
@@ -570,7 +630,7 @@ async def run_interactive(
                     handle_event(event)
             finally:
                 # Remove signal handler after turn
-                if platform.system() != "Windows":
+                if not IS_WINDOWS:
                     loop.remove_signal_handler(signal.SIGINT)
 
             # Exit session if killed externally
@@ -580,9 +640,12 @@ async def run_interactive(
         session_status = "error"
         raise
     finally:
+        warm_task.cancel()
+
         # End observability session
         if observability:
             await observability.end_session(session_status)
+        await agent.aclose()
 
         # Save conversation on exit (only if there's history)
         if session.history:
@@ -612,13 +675,13 @@ async def run_single(
     if observability:
         await observability.start_session()
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
     def on_cancel():
         console.print("\n[yellow]Cancelling...[/yellow]")
         agent.request_cancel()
 
-    if platform.system() != "Windows":
+    if not IS_WINDOWS:
         loop.add_signal_handler(signal.SIGINT, on_cancel)
 
     session_status = "completed"
@@ -643,10 +706,11 @@ async def run_single(
         session_status = "error"
         raise
     finally:
-        if platform.system() != "Windows":
+        if not IS_WINDOWS:
             loop.remove_signal_handler(signal.SIGINT)
         if observability:
             await observability.end_session(session_status)
+        await agent.aclose()
 
 
 async def run_single_with_output(
@@ -671,67 +735,93 @@ async def run_single_with_output(
         )
         return False
 
+    # Stream text to a side file as it arrives; it is renamed into place
+    # only once the turn completes
+    partial_file = output_file.with_name(output_file.name + ".partial")
+    try:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        out = partial_file.open("w", encoding="utf-8")
+    except OSError as exc:
+        console.print(f"[red]Failed to write output: {exc}[/red]")
+        return False
+
     # Start observability session if enabled
     if observability:
         await observability.start_session()
 
-    collected_text: list[str] = []
     cancelled = False
+    completed = False
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
     def on_cancel():
         console.print("\n[yellow]Cancelling...[/yellow]")
         agent.request_cancel()
 
-    if platform.system() != "Windows":
+    if not IS_WINDOWS:
         loop.add_signal_handler(signal.SIGINT, on_cancel)
 
     session_status = "completed"
     try:
-        # Wrap event stream with observability if enabled
-        events = agent.run_turn(prompt)
-        if observability:
-            events = observability.wrap_turn(events, prompt)
-
-        async for event in events:
-            if event.type == "cancelled":
-                if signal_manager and session_id and signal_manager.is_cancelled(session_id):
-                    session_status = "cancelled"
-                    if observability:
-                        observability.context.metadata["cancel_source"] = "kill_command"
-                    console.print("[yellow]Killed by ro-agent kill[/yellow]")
-                else:
-                    console.print("[dim]Cancelled[/dim]")
-                cancelled = True
-                break
-            handle_event(event)
-            # Collect text for output file
-            if event.type == "text" and event.content:
-                collected_text.append(event.content)
+        with out:
+            # Wrap event stream with observability if enabled
+            events = agent.run_turn(prompt)
+            if observability:
+                events = observability.wrap_turn(events, prompt)
+
+            async for event in events:
+                if event.type == "cancelled":
+                    if signal_manager and session_id and signal_manager.is_cancelled(session_id):
+                        session_status = "cancelled"
+                        if observability:
+                            observability.context.metadata["cancel_source"] = "kill_command"
+                        console.print("[yellow]Killed by ro-agent kill[/yellow]")
+                    else:
+                        console.print("[dim]Cancelled[/dim]")
+                    cancelled = True
+                    break
+                handle_event(event)
+                # Write text to output file
+                if event.type == "text" and event.content:
+                    out.write(event.content)
+        completed = not cancelled
     except Exception:
         session_status = "error"
         raise
     finally:
-        if platform.system() != "Windows":
+        # Also covers KeyboardInterrupt and task cancellation
+        if not completed:
+            partial_file.unlink(missing_ok=True)
+        if not IS_WINDOWS:
             loop.remove_signal_handler(signal.SIGINT)
         if observability:
             await observability.end_session(session_status)
+        await agent.aclose()
 
     if cancelled:
         return False
 
-    # Write collected text to output file
+    # Move the completed output into place
     try:
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text("".join(collected_text), encoding="utf-8")
+        partial_file.replace(output_file)
         console.print(f"\n[green]Output written to: {output_file}[/green]")
         return True
-    except Exception as exc:
+    except OSError as exc:
         console.print(f"\n[red]Failed to write output: {exc}[/red]")
         return False
 
 
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Use uvloop's event loop when it is installed, else asyncio's default."""
+    if IS_WINDOWS:
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 @app.command()
 def main(
     prompt: Annotated[
@@ -739,13 +829,21 @@ def main(
         typer.Argument(help="Single prompt to run (omit for interactive mode)"),
     ] = None,
     model: Annotated[
-        str,
-        typer.Option("--model", "-m", help="Model to use"),
-    ] = os.getenv("OPENAI_MODEL", "gpt-5-mini"),
+        Optional[str],
+        typer.Option(
+            "--model",
+            "-m",
+            help="Model to use (defaults to $OPENAI_MODEL, then gpt-5-mini)",
+        ),
+    ] = None,
     base_url: Annotated[
         Optional[str],
-        typer.Option("--base-url", help="API base URL for OpenAI-compatible endpoints"),
-    ] = os.getenv("OPENAI_BASE_URL"),
+        typer.Option(
+            "--base-url",
+            envvar="OPENAI_BASE_URL",
+            help="API base URL for OpenAI-compatible endpoints",
+        ),
+    ] = None,
     system: Annotated[
         Optional[str],
         typer.Option("--system", "-s", help="Override system prompt entirely"),
@@ -793,16 +891,19 @@ def main(
     preview_lines: Annotated[
         int,
         typer.Option(
-            "--preview-lines", help="Lines of tool output to show (0 to disable)"
+            "--preview-lines",
+            envvar="RO_AGENT_PREVIEW_LINES",
+            help="Lines of tool output to show (0 to disable)",
         ),
-    ] = int(os.getenv("RO_AGENT_PREVIEW_LINES", "6")),
+    ] = 6,
     profile: Annotated[
         Optional[str],
         typer.Option(
             "--profile",
+            envvar="RO_AGENT_PROFILE",
             help="Capability profile: 'readonly' (default), 'developer', 'eval', or path to YAML",
         ),
-    ] = os.getenv("RO_AGENT_PROFILE"),
+    ] = None,
     shell_mode: Annotated[
         Optional[str],
         typer.Option(
@@ -821,23 +922,26 @@ def main(
         Optional[str],
         typer.Option(
             "--team-id",
+            envvar="RO_AGENT_TEAM_ID",
             help="Team ID for observability (enables telemetry)",
         ),
-    ] = os.getenv("RO_AGENT_TEAM_ID"),
+    ] = None,
     project_id: Annotated[
         Optional[str],
         typer.Option(
             "--project-id",
+            envvar="RO_AGENT_PROJECT_ID",
             help="Project ID for observability (enables telemetry)",
         ),
-    ] = os.getenv("RO_AGENT_PROJECT_ID"),
+    ] = None,
     observability_config: Annotated[
         Optional[str],
         typer.Option(
             "--observability-config",
+            envvar="RO_AGENT_OBSERVABILITY_CONFIG",
             help="Path to observability config file",
         ),
-    ] = os.getenv("RO_AGENT_OBSERVABILITY_CONFIG"),
+    ] = None,
 ) -> None:
     """ro-agent: A read-only research assistant."""
     # Set preview lines for tool output display
@@ -887,6 +991,16 @@ def main(
             console.print("[dim]Use --list to see saved conversations.[/dim]")
             raise typer.Exit(1)
 
+    from .capabilities import CapabilityProfile, FileWriteMode, ShellMode
+    from .capabilities.factory import load_profile
+    from .client.model import ModelClient
+    from .core.agent import Agent
+    from .core.session import Session
+    from .observability.config import ObservabilityConfig
+    from .observability.context import TelemetryContext
+    from .observability.processor import ObservabilityProcessor
+    from .prompts import load_prompt, parse_vars, prepare_prompt
+
     # Resolve working directory
     resolved_working_dir = (
         str(Path(working_dir).expanduser().resolve()) if working_dir else os.getcwd()
@@ -954,6 +1068,8 @@ def main(
                 console.print(f"[red]Vars file not found: {vars_path}[/red]")
                 raise typer.Exit(1)
             try:
+                import yaml
+
                 with open(vars_path, encoding="utf-8") as f:
                     file_vars = yaml.safe_load(f)
                 if isinstance(file_vars, dict):
@@ -985,15 +1101,7 @@ def main(
             raise typer.Exit(1) from exc
 
         # Provide profile-aware variables (same as builtin)
-        prompt_vars = {
-            "platform": platform.system(),
-            "home_dir": str(Path.home()),
-            "working_dir": resolved_working_dir,
-            "profile_name": capability_profile.name,
-            "shell_mode": capability_profile.shell.value,
-            "file_write_mode": capability_profile.file_write.value,
-            "database_mode": capability_profile.database.value,
-        }
+        prompt_vars = _default_prompt_vars(resolved_working_dir, capability_profile)
 
         try:
             system_prompt, initial_prompt = prepare_prompt(loaded_prompt, prompt_vars)
@@ -1007,24 +1115,14 @@ def main(
         except (FileNotFoundError, ValueError) as exc:
             # Fallback to inline prompt if file is missing
             console.print(f"[yellow]Warning: Could not load default prompt: {exc}[/yellow]")
-            system_prompt = DEFAULT_SYSTEM_PROMPT.format(
-                platform=platform.system(),
-                home_dir=str(Path.home()),
-                working_dir=resolved_working_dir,
+            system_prompt = DEFAULT_SYSTEM_PROMPT.format_map(
+                _default_prompt_vars(resolved_working_dir, capability_profile)
             )
             loaded_prompt = None
 
         if loaded_prompt:
             # Provide profile-aware variables
-            prompt_vars = {
-                "platform": platform.system(),
-                "home_dir": str(Path.home()),
-                "working_dir": resolved_working_dir,
-                "profile_name": capability_profile.name,
-                "shell_mode": capability_profile.shell.value,
-                "file_write_mode": capability_profile.file_write.value,
-                "database_mode": capability_profile.database.value,
-            }
+            prompt_vars = _default_prompt_vars(resolved_working_dir, capability_profile)
             try:
                 system_prompt, initial_prompt = prepare_prompt(loaded_prompt, prompt_vars)
             except ValueError as exc:
@@ -1038,17 +1136,13 @@ def main(
         session.total_input_tokens = resumed_conversation.input_tokens
         session.total_output_tokens = resumed_conversation.output_tokens
         # Use the model from resumed conversation unless explicitly overridden
-        effective_model = (
-            model
-            if model != os.getenv("OPENAI_MODEL", "gpt-5-nano")
-            else resumed_conversation.model
-        )
+        effective_model = model or resumed_conversation.model
         # Parse the original start time
         session_started = datetime.fromisoformat(resumed_conversation.started)
         console.print(f"[green]Resuming conversation: {conversation_id}[/green]")
     else:
         session = Session(system_prompt=system_prompt)
-        effective_model = model
+        effective_model = model or os.getenv("OPENAI_MODEL", DEFAULT_MODEL)
 
     registry = create_registry(working_dir=resolved_working_dir, profile=capability_profile)
     client = ModelClient(model=effective_model, base_url=base_url)
@@ -1072,7 +1166,6 @@ def main(
                 project_id=project_id,
             )
             if obs_config.enabled and obs_config.tenant:
-                from .observability.context import TelemetryContext
                 context = TelemetryContext.from_config(
                     obs_config,
                     model=effective_model,
@@ -1102,35 +1195,36 @@ def main(
     signal_manager.register(agent_info)
 
     try:
-        if run_prompt:
-            # Single prompt mode (from --prompt or positional arg)
-            if output:
-                # Capture output to file
-                asyncio.run(run_single_with_output(
-                    agent, run_prompt, output, observability_processor,
-                    signal_manager=signal_manager, session_id=session_id,
-                ))
+        with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+            if run_prompt:
+                # Single prompt mode (from --prompt or positional arg)
+                if output:
+                    # Capture output to file
+                    runner.run(run_single_with_output(
+                        agent, run_prompt, output, observability_processor,
+                        signal_manager=signal_manager, session_id=session_id,
+                    ))
+                else:
+                    runner.run(run_single(
+                        agent, run_prompt, observability_processor,
+                        signal_manager=signal_manager, session_id=session_id,
+                    ))
             else:
-                asyncio.run(run_single(
-                    agent, run_prompt, observability_processor,
-                    signal_manager=signal_manager, session_id=session_id,
-                ))
-        else:
-            asyncio.run(
-                run_interactive(
-                    agent,
-                    approval_handler,
-                    session,
-                    effective_model,
-                    resolved_working_dir,
-                    conversation_store,
-                    session_started,
-                    conversation_id,
-                    observability_processor,
-                    signal_manager=signal_manager,
-                    session_id=session_id,
+                runner.run(
+                    run_interactive(
+                        agent,
+                        approval_handler,
+                        session,
+                        effective_model,
+                        resolved_working_dir,
+                        conversation_store,
+                        session_started,
+                        conversation_id,
+                        observability_processor,
+                        signal_manager=signal_manager,
+                        session_id=session_id,
+                    )
                 )
-            )
     finally:
         signal_manager.deregister(session_id)
 
@@ -1148,7 +1242,8 @@ def dashboard(
 ) -> None:
     """Launch the observability dashboard."""
     import subprocess
-    import sys
+
+    from .observability.config import DEFAULT_TELEMETRY_DB
 
     # Set database path in environment
     resolved_db = db_path or str(DEFAULT_TELEMETRY_DB)
@@ -1,14 +1,42 @@
 """Model client for streaming API calls via OpenAI-compatible API."""
 
+import asyncio
+import hashlib
 import json
+import time
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Required, TypedDict
 
 from openai import AsyncOpenAI, APIStatusError
 
+from .ratelimit import RateLimiter
 
-@dataclass
+# Prefer orjson for decoding tool-call arguments when it is installed.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so callers only
+# need to handle the stdlib exception.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Providers, matched against the base URL, that can't stream tool calls
+NON_STREAMING_TOOL_PROVIDERS = ("cerebras",)
+
+# Streamed text deltas (often a single token each) are coalesced into one
+# text event until this much time has passed or this many chars are held
+TEXT_FLUSH_INTERVAL = 0.005
+TEXT_FLUSH_CHARS = 256
+
+# AsyncOpenAI clients in use, keyed by (event loop, base_url, api_key,
+# timeout), with how many ModelClients hold each. httpx connections are
+# bound to the loop that opened them, so a client is only shared within
+# its loop, and it's closed when the last ModelClient holding it closes.
+_SHARED_CLIENTS: dict[tuple[Any, ...], tuple[AsyncOpenAI, int]] = {}
+
+
+@dataclass(slots=True)
 class ToolCall:
     """A tool call from the model."""
 
@@ -17,7 +45,7 @@ class ToolCall:
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamEvent:
     """An event from the model stream."""
 
@@ -28,17 +56,19 @@ class StreamEvent:
     usage: dict[str, int] | None = None
 
 
-@dataclass
-class Message:
-    """A message in the conversation."""
+class Message(TypedDict, total=False):
+    """A message in the conversation, in OpenAI's API format.
+
+    A plain dict at runtime, so session history is sent as-is.
+    """
 
-    role: str  # "user", "assistant", "system", "tool"
-    content: str | list[dict[str, Any]] | None = None
-    tool_calls: list[dict[str, Any]] | None = None
-    tool_call_id: str | None = None
+    role: Required[str]  # "user", "assistant", "system", "tool"
+    content: str | list[dict[str, Any]] | None
+    tool_calls: list[dict[str, Any]]
+    tool_call_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Prompt:
     """A prompt to send to the model."""
 
@@ -47,6 +77,97 @@ class Prompt:
     tools: list[dict[str, Any]] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class _ToolCallBuilder:
+    """A tool call being assembled from streamed deltas."""
+
+    id: str
+    name: str
+    # Argument fragments, joined once when the call is complete
+    arguments: list[str] = field(default_factory=list)
+
+    def build(self) -> ToolCall:
+        """Create the finished tool call."""
+        return ToolCall(
+            id=self.id,
+            name=self.name,
+            arguments=_parse_tool_arguments("".join(self.arguments)),
+        )
+
+
+def _close_partial_json(text: str) -> str:
+    """Trim a truncated JSON object back to its complete fields and close it.
+
+    Best-effort repair of tool-call arguments cut off mid-stream (e.g. by
+    a length limit). Only top-level fields whose values arrived in full are
+    kept. A value that may be incomplete (an open string, number, literal,
+    array or object) is dropped whole rather than guessed at, so a tool
+    never runs with a silently shortened path, command or list.
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    in_value = False  # past the ":" of the current top-level field
+    end = 0  # end of the last complete top-level field
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+                if depth == 1 and in_value:
+                    end = i + 1
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if depth == 1:
+                end = i + 1
+            elif depth == 0:
+                return text  # Not truncated, just invalid
+        elif depth == 1:
+            if ch == ":":
+                in_value = True
+            elif ch == ",":
+                end = i
+                in_value = False
+
+    if not text.lstrip().startswith("{"):
+        return text
+    return text[:end] + "}" if end else "{}"
+
+
+def _parse_tool_arguments(raw: str | None) -> dict[str, Any]:
+    """Parse a tool call's JSON arguments, salvaging truncated payloads."""
+    if not raw or raw == "{}":
+        # No-argument tools; skip the decoder entirely
+        return {}
+    try:
+        args = _json_loads(raw)
+    except json.JSONDecodeError:
+        # The stdlib decoder here also accepts the few inputs orjson rejects
+        # (NaN, integers beyond 64 bits)
+        try:
+            args = json.loads(_close_partial_json(raw))
+        except json.JSONDecodeError:
+            return {}
+    return args if isinstance(args, dict) else {}
+
+
+def _usage_dict(usage: Any) -> dict[str, int]:
+    """Convert a completion's usage object to input/output token counts."""
+    if usage is None:
+        return {"input_tokens": 0, "output_tokens": 0}
+    return {
+        "input_tokens": usage.prompt_tokens,
+        "output_tokens": usage.completion_tokens,
+    }
+
+
 class ModelClient:
     """Client for streaming API calls via OpenAI-compatible API.
 
@@ -64,29 +185,110 @@ class ModelClient:
         # For flex processing, use longer timeout (15 min) per OpenAI docs
         if timeout is None:
             timeout = 900.0 if service_tier == "flex" else 60.0
-        self._client = AsyncOpenAI(
-            base_url=base_url, api_key=api_key, timeout=timeout, max_retries=8,
-        )
+        # Shared AsyncOpenAI client, joined on first use inside the loop
+        self._client_args = (base_url, api_key, timeout)
+        self._client: AsyncOpenAI | None = None
+        self._client_key: tuple[Any, ...] | None = None
         self._model = model
         self._service_tier = service_tier
         self._base_url = base_url or ""
 
-        # Cerebras doesn't support streaming with tool calling
-        self._use_nonstreaming_tools = "cerebras" in self._base_url.lower()
+        # Provider quirks, resolved once from the base URL
+        host = self._base_url.lower()
+        self._use_nonstreaming_tools = any(
+            provider in host for provider in NON_STREAMING_TOOL_PROVIDERS
+        )
+
+        # System message reused while the prompt is unchanged, and the
+        # prompt_cache_key derived from it (OpenAI only; other
+        # OpenAI-compatible servers may reject unknown parameters)
+        self._system_message: dict[str, Any] | None = None
+        self._prompt_cache_key = ""
+        self._send_prompt_cache_key = not host or "api.openai.com" in host
+
+        self._rate_limiter = RateLimiter()
+        # The last request's messages and its reported input + output
+        # tokens, so the next estimate only measures what was appended
+        self._sent_count = 0
+        self._sent_last: Any = None
+        self._sent_tokens = 0
+
+    def _openai(self) -> AsyncOpenAI:
+        """Return the AsyncOpenAI client, sharing one per loop and settings."""
+        if self._client is None:
+            key = (asyncio.get_running_loop(), *self._client_args)
+            client, users = _SHARED_CLIENTS.get(key, (None, 0))
+            if client is None:
+                base_url, api_key, timeout = self._client_args
+                client = AsyncOpenAI(
+                    base_url=base_url, api_key=api_key, timeout=timeout, max_retries=8,
+                )
+            _SHARED_CLIENTS[key] = (client, users + 1)
+            self._client, self._client_key = client, key
+        return self._client
+
+    async def aclose(self) -> None:
+        """Release the shared client, closing it if no other ModelClient uses it."""
+        key, self._client_key = self._client_key, None
+        self._client = None
+        if key is None:
+            return
+        client, users = _SHARED_CLIENTS.pop(key)
+        if users > 1:
+            _SHARED_CLIENTS[key] = (client, users - 1)
+        else:
+            await client.close()
+
+    def _estimate_tokens(self, messages: list[dict[str, Any]]) -> int:
+        """Roughly estimate a request's tokens (4 chars ≈ 1 token).
+
+        When the messages extend the previous request's, that request's
+        reported usage stands in for them and only the new ones are
+        serialized.
+        """
+        start, tokens = 0, 0
+        count = self._sent_count
+        if self._sent_tokens and 0 < count <= len(messages):
+            if messages[count - 1] is self._sent_last:
+                start, tokens = count, self._sent_tokens
+        tokens += sum(len(json.dumps(m, default=str)) for m in messages[start:]) // 4
+        self._sent_count = len(messages)
+        self._sent_last = messages[-1] if messages else None
+        self._sent_tokens = 0  # Until this request's usage arrives
+        return tokens
+
+    def _record_usage(self, input_tokens: int, output_tokens: int) -> None:
+        """Note the tokens the last request used, for the next estimate."""
+        self._sent_tokens = input_tokens + output_tokens
+
+    async def _acquire(self, kwargs: dict[str, Any]) -> None:
+        """Wait until the request fits the provider's reported rate limits."""
+        limiter = self._rate_limiter
+        tokens = 0
+        if limiter.tracks_tokens:
+            # Only made when it matters
+            tokens = self._estimate_tokens(kwargs["messages"])
+        await limiter.acquire(tokens)
+
+    async def _create(self, kwargs: dict[str, Any]) -> Any:
+        """Create a non-streaming chat completion, pacing it against rate limits."""
+        await self._acquire(kwargs)
+        raw = await self._openai().chat.completions.with_raw_response.create(**kwargs)
+        self._rate_limiter.update(raw.headers)
+        response = raw.parse()
+        usage = _usage_dict(response.usage)
+        self._record_usage(usage["input_tokens"], usage["output_tokens"])
+        return response
 
     def _build_messages(self, prompt: Prompt) -> list[dict[str, Any]]:
         """Build messages list from prompt."""
-        messages: list[dict[str, Any]] = [{"role": "system", "content": prompt.system}]
-        for msg in prompt.messages:
-            m: dict[str, Any] = {"role": msg.role}
-            if msg.content is not None:
-                m["content"] = msg.content
-            if msg.tool_calls:
-                m["tool_calls"] = msg.tool_calls
-            if msg.tool_call_id:
-                m["tool_call_id"] = msg.tool_call_id
-            messages.append(m)
-        return messages
+        system = self._system_message
+        if system is None or system["content"] != prompt.system:
+            system = self._system_message = {"role": "system", "content": prompt.system}
+            self._prompt_cache_key = hashlib.sha256(
+                prompt.system.encode("utf-8")
+            ).hexdigest()[:32]
+        return [system, *prompt.messages]
 
     async def stream(self, prompt: Prompt) -> AsyncIterator[StreamEvent]:
         """Stream a response from the model."""
@@ -108,84 +310,142 @@ class ModelClient:
         if prompt.tools:
             kwargs["tools"] = prompt.tools
 
+        if self._send_prompt_cache_key:
+            # Route requests sharing this system prompt to the same cache
+            kwargs["prompt_cache_key"] = self._prompt_cache_key
+
         if self._service_tier:
             kwargs["service_tier"] = self._service_tier
 
-        try:
-            # Track tool calls being built
-            tool_calls_in_progress: dict[int, dict[str, str]] = {}
+        # Text not yet emitted, flushed before any other event
+        pending_text: list[str] = []
+        pending_chars = 0
+        flush_at = 0.0
 
-            async with await self._client.chat.completions.create(**kwargs) as stream:
-                async for chunk in stream:
-                    if not chunk.choices:
+        try:
+            # Track tool calls being built, by index
+            tool_calls_in_progress: dict[int, _ToolCallBuilder] = {}
+            # Locals for the per-chunk loop
+            stream_event = StreamEvent
+            monotonic = time.monotonic
+            loads = _json_loads
+
+            await self._acquire(kwargs)
+            # Read the SSE lines directly: chunks are small, short-lived dicts,
+            # so the SDK's per-chunk model validation is pure overhead here
+            async with self._openai().chat.completions.with_streaming_response.create(
+                **kwargs
+            ) as response:
+                self._rate_limiter.update(response.headers)
+                async for line in response.iter_lines():
+                    if not line.startswith("data:"):
+                        continue  # Blank separators, comments, event names
+                    data = line[5:].lstrip()
+                    if data.startswith("[DONE]"):
+                        break
+                    chunk = loads(data)
+
+                    error = chunk.get("error")
+                    if error:
+                        message = error.get("message") if isinstance(error, dict) else None
+                        if pending_text:
+                            yield stream_event(type="text", content="".join(pending_text))
+                            pending_text.clear()
+                        yield stream_event(
+                            type="error",
+                            content=message or "An error occurred during streaming",
+                        )
+                        return
+
+                    choices = chunk.get("choices")
+                    if not choices:
+                        if pending_text:
+                            yield stream_event(type="text", content="".join(pending_text))
+                            pending_text.clear()
+                            pending_chars = 0
                         # Usage info comes in final chunk with no choices
-                        if chunk.usage:
-                            yield StreamEvent(
+                        usage = chunk.get("usage")
+                        if usage:
+                            input_tokens = usage.get("prompt_tokens") or 0
+                            output_tokens = usage.get("completion_tokens") or 0
+                            self._record_usage(input_tokens, output_tokens)
+                            yield stream_event(
                                 type="done",
                                 usage={
-                                    "input_tokens": chunk.usage.prompt_tokens,
-                                    "output_tokens": chunk.usage.completion_tokens,
+                                    "input_tokens": input_tokens,
+                                    "output_tokens": output_tokens,
                                 },
                             )
                         continue
 
-                    choice = chunk.choices[0]
-                    delta = choice.delta
+                    choice = choices[0]
+                    delta = choice.get("delta") or {}
 
                     # Text content
-                    if delta.content:
-                        yield StreamEvent(type="text", content=delta.content)
+                    text = delta.get("content")
+                    if text:
+                        pending_text.append(text)
+                        pending_chars += len(text)
+
+                    delta_tool_calls = delta.get("tool_calls")
+                    finish_reason = choice.get("finish_reason")
+
+                    # Held text goes out once due, and always ahead of tool
+                    # calls and the finish so it keeps its place in the turn
+                    if pending_text:
+                        now = monotonic()
+                        if (
+                            delta_tool_calls
+                            or finish_reason
+                            or now >= flush_at
+                            or pending_chars >= TEXT_FLUSH_CHARS
+                        ):
+                            yield stream_event(type="text", content="".join(pending_text))
+                            pending_text.clear()
+                            pending_chars = 0
+                            flush_at = now + TEXT_FLUSH_INTERVAL
 
                     # Tool calls
-                    if delta.tool_calls:
-                        for tc in delta.tool_calls:
-                            idx = tc.index
-                            if idx not in tool_calls_in_progress:
-                                tool_calls_in_progress[idx] = {
-                                    "id": tc.id or "",
-                                    "name": tc.function.name if tc.function else "",
-                                    "arguments": "",
-                                }
-                            if tc.id:
-                                tool_calls_in_progress[idx]["id"] = tc.id
-                            if tc.function:
-                                if tc.function.name:
-                                    tool_calls_in_progress[idx]["name"] = (
-                                        tc.function.name
-                                    )
-                                if tc.function.arguments:
-                                    tool_calls_in_progress[idx]["arguments"] += (
-                                        tc.function.arguments
-                                    )
+                    if delta_tool_calls:
+                        for tc in delta_tool_calls:
+                            fn = tc.get("function") or {}
+                            tc_id = tc.get("id")
+                            idx = tc.get("index", 0)
+                            name = fn.get("name")
+                            builder = tool_calls_in_progress.get(idx)
+                            if builder is None:
+                                builder = tool_calls_in_progress[idx] = _ToolCallBuilder(
+                                    id=tc_id or "", name=name or ""
+                                )
+                            else:
+                                if tc_id:
+                                    builder.id = tc_id
+                                if name:
+                                    builder.name = name
+                            arguments = fn.get("arguments")
+                            if arguments:
+                                builder.arguments.append(arguments)
 
                     # Check for finish
-                    if choice.finish_reason:
+                    if finish_reason:
                         # Emit any completed tool calls
-                        for tc_data in tool_calls_in_progress.values():
-                            try:
-                                args = (
-                                    json.loads(tc_data["arguments"])
-                                    if tc_data["arguments"]
-                                    else {}
-                                )
-                            except json.JSONDecodeError:
-                                args = {}
-                            yield StreamEvent(
-                                type="tool_call",
-                                tool_call=ToolCall(
-                                    id=tc_data["id"],
-                                    name=tc_data["name"],
-                                    arguments=args,
-                                ),
-                            )
+                        for builder in tool_calls_in_progress.values():
+                            yield stream_event(type="tool_call", tool_call=builder.build())
                         tool_calls_in_progress.clear()
 
+            if pending_text:
+                yield stream_event(type="text", content="".join(pending_text))
+
         except APIStatusError as e:
+            if pending_text:
+                yield StreamEvent(type="text", content="".join(pending_text))
             yield StreamEvent(
                 type="error",
                 content=f"API error {e.status_code} (after retries): {e.message}",
             )
         except Exception as e:
+            if pending_text:
+                yield StreamEvent(type="text", content="".join(pending_text))
             yield StreamEvent(type="error", content=str(e))
 
     async def _stream_via_complete(self, prompt: Prompt) -> AsyncIterator[StreamEvent]:
@@ -208,7 +468,7 @@ class ModelClient:
             kwargs["service_tier"] = self._service_tier
 
         try:
-            response = await self._client.chat.completions.create(**kwargs)
+            response = await self._create(kwargs)
             choice = response.choices[0]
             msg = choice.message
 
@@ -219,25 +479,17 @@ class ModelClient:
             # Emit tool calls if present
             if msg.tool_calls:
                 for tc in msg.tool_calls:
-                    try:
-                        args = json.loads(tc.function.arguments) if tc.function.arguments else {}
-                    except json.JSONDecodeError:
-                        args = {}
                     yield StreamEvent(
                         type="tool_call",
                         tool_call=ToolCall(
                             id=tc.id,
                             name=tc.function.name,
-                            arguments=args,
+                            arguments=_parse_tool_arguments(tc.function.arguments),
                         ),
                     )
 
             # Emit done with usage
-            usage = {
-                "input_tokens": response.usage.prompt_tokens if response.usage else 0,
-                "output_tokens": response.usage.completion_tokens if response.usage else 0,
-            }
-            yield StreamEvent(type="done", usage=usage)
+            yield StreamEvent(type="done", usage=_usage_dict(response.usage))
 
         except APIStatusError as e:
             yield StreamEvent(
@@ -263,15 +515,9 @@ class ModelClient:
             if self._service_tier:
                 kwargs["service_tier"] = self._service_tier
 
-            response = await self._client.chat.completions.create(**kwargs)
+            response = await self._create(kwargs)
             content = response.choices[0].message.content or ""
-            usage = {
-                "input_tokens": response.usage.prompt_tokens if response.usage else 0,
-                "output_tokens": response.usage.completion_tokens
-                if response.usage
-                else 0,
-            }
-            return content, usage
+            return content, _usage_dict(response.usage)
         except APIStatusError as e:
             return (
                 f"API error {e.status_code} (after retries): {e.message}",
@@ -0,0 +1,105 @@
+"""Client-side pacing based on OpenAI-style rate-limit headers."""
+
+import asyncio
+import re
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+# Reset durations look like "1s", "6m0s", "20ms" or "1h2m3.5s"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_duration(value: str) -> float | None:
+    """Parse a rate-limit reset duration into seconds."""
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _UNIT_SECONDS[unit] for amount, unit in parts)
+
+
+@dataclass(slots=True)
+class _Budget:
+    """Remaining allowance in the current rate-limit window."""
+
+    remaining: int | None = None  # None until a response reports it
+    reset_at: float = 0.0  # time.monotonic() when the window resets
+
+    def delay(self, amount: int, now: float) -> float:
+        """Seconds to wait before `amount` fits in the budget."""
+        if self.remaining is None or now >= self.reset_at:
+            return 0.0
+        if self.remaining >= amount:
+            return 0.0
+        return self.reset_at - now
+
+    def consume(self, amount: int, now: float) -> None:
+        """Account for a request that is about to be sent."""
+        if self.remaining is None:
+            return
+        if now >= self.reset_at:
+            # The window has rolled over; wait for the next response
+            self.remaining = None
+        else:
+            self.remaining = max(0, self.remaining - amount)
+
+    def update(self, remaining: str | None, reset: str | None, now: float) -> None:
+        """Refresh from a response's remaining/reset header values."""
+        if remaining is None or reset is None:
+            return
+        seconds = _parse_duration(reset)
+        try:
+            count = int(remaining)
+        except ValueError:
+            return
+        if seconds is None:
+            return
+        self.remaining = count
+        self.reset_at = now + seconds
+
+
+class RateLimiter:
+    """Paces requests against the provider's reported rate limits.
+
+    OpenAI-compatible APIs report the requests and tokens left in the
+    current window via x-ratelimit-* response headers. When a budget is
+    exhausted, acquire() sleeps until the window resets rather than sending
+    a request that would fail with a 429 and be retried with backoff.
+    Providers that don't send the headers are never delayed.
+    """
+
+    MAX_WAIT = 60.0  # Never sleep longer than this on a single request
+
+    def __init__(self) -> None:
+        self._requests = _Budget()
+        self._tokens = _Budget()
+
+    @property
+    def tracks_tokens(self) -> bool:
+        """Whether a token budget is known, i.e. estimates are worth making."""
+        return self._tokens.remaining is not None
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until a request of roughly `tokens` tokens fits the budget."""
+        now = time.monotonic()
+        delay = max(self._requests.delay(1, now), self._tokens.delay(tokens, now))
+        if delay > 0:
+            await asyncio.sleep(min(delay, self.MAX_WAIT))
+            now = time.monotonic()
+        self._requests.consume(1, now)
+        self._tokens.consume(tokens, now)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Record the budgets reported by a response."""
+        now = time.monotonic()
+        self._requests.update(
+            headers.get("x-ratelimit-remaining-requests"),
+            headers.get("x-ratelimit-reset-requests"),
+            now,
+        )
+        self._tokens.update(
+            headers.get("x-ratelimit-remaining-tokens"),
+            headers.get("x-ratelimit-reset-tokens"),
+            now,
+        )
@@ -0,0 +1,183 @@
+"""Inline file path completion for the interactive prompt."""
+
+import asyncio
+import bisect
+import functools
+import os
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Any
+
+from prompt_toolkit.completion import Completer, Completion
+from prompt_toolkit.document import Document
+
+# Maximum path completions offered per keystroke
+MAX_PATH_COMPLETIONS = 200
+
+# Characters that can appear in a completable path (a leading ~ is handled separately)
+PATH_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-./"
+)
+
+
+def _trailing_path(text: str) -> str | None:
+    """Return the path-like token at the end of text, if any.
+
+    A token is the trailing run of PATH_CHARS, optionally preceded by ~.
+    It only counts as a path if it contains a slash or starts with ~.
+    """
+    start = len(text)
+    while start > 0 and text[start - 1] in PATH_CHARS:
+        start -= 1
+    if start > 0 and text[start - 1] == "~":
+        start -= 1
+
+    path_text = text[start:]
+    if path_text[:1] == "~" or "/" in path_text:
+        return path_text
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _list_dir(path: str, mtime_ns: int) -> tuple[tuple[str, bool], ...]:
+    """List a directory as sorted (name, is_dir) pairs.
+
+    Keyed on the directory's mtime so that a change to the directory
+    produces a fresh listing instead of a stale cached one.
+    """
+    entries = []
+    # scandir entries carry the file type from readdir, so is_dir()
+    # normally needs no extra stat call
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            entries.append((entry.name, is_dir))
+    entries.sort()
+    return tuple(entries)
+
+
+# Single worker for path completion I/O, isolated from the default executor
+_completer_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="ro-completer"
+)
+
+
+def _warm_dir_cache(*paths: str) -> None:
+    """Populate the directory listing cache for likely completion roots."""
+    for path in paths:
+        try:
+            _list_dir(path, os.stat(path).st_mtime_ns)
+        except OSError:
+            continue
+
+
+def warm_dir_cache(*paths: str) -> asyncio.Future[None]:
+    """List paths into the cache in the background, on the completer thread.
+
+    Must be called from a running event loop. Running on the completer
+    thread means an early completion waits for the warm-up rather than
+    listing the same directory a second time.
+    """
+    return asyncio.get_running_loop().run_in_executor(
+        _completer_executor, _warm_dir_cache, *paths
+    )
+
+
+class InlinePathCompleter(Completer):
+    """Completes file paths that appear anywhere in the input text."""
+
+    def __init__(self, working_dir: str | None = None) -> None:
+        self.working_dir = (
+            os.path.expanduser(working_dir) if working_dir else os.getcwd()
+        )
+        # Joined with relative input on every keystroke, so keep a string form
+        self._working_dir_prefix = os.path.join(self.working_dir, "")
+
+    async def get_completions_async(
+        self, document: Document, complete_event: Any
+    ) -> AsyncIterator[Completion]:
+        """Compute completions on the dedicated completer thread.
+
+        Keeps directory I/O off the event loop and out of the default
+        executor, where it could queue behind unrelated blocking work.
+        """
+        loop = asyncio.get_running_loop()
+        completions = await loop.run_in_executor(
+            _completer_executor,
+            lambda: list(self.get_completions(document, complete_event)),
+        )
+        for completion in completions:
+            yield completion
+
+    def get_completions(
+        self, document: Document, complete_event: Any
+    ) -> Iterable[Completion]:
+        text_before_cursor = document.text_before_cursor
+
+        path_text = _trailing_path(text_before_cursor)
+        if not path_text:
+            return
+
+        start_pos = -len(path_text)
+
+        # Expand paths for lookup
+        if path_text.startswith("~"):
+            expanded = os.path.expanduser(path_text)
+        elif path_text.startswith("/"):
+            expanded = path_text
+        else:
+            expanded = self._working_dir_prefix + path_text
+
+        # Split into the directory to list and the name prefix to match,
+        # using plain string slicing rather than Path objects
+        sep = expanded.rfind("/")
+        parent = expanded[:sep] if sep > 0 else ("/" if sep == 0 else ".")
+        prefix = expanded[sep + 1 :]
+
+        # Hidden entries are only offered when the user has typed a leading dot
+        show_hidden = prefix.startswith(".")
+
+        try:
+            entries = _list_dir(parent, os.stat(parent).st_mtime_ns)
+        except OSError:
+            return
+
+        # Everything before the entry name is the same for every candidate:
+        # the typed text up to its last slash, preserving the user's path style
+        if "/" in path_text:
+            base = path_text[: path_text.rfind("/") + 1]
+        else:
+            base = "~/" if path_text[:1] == "~" else ""
+
+        # Entries are sorted by name, so matches form one contiguous run
+        # starting at the first name >= prefix
+        remaining = MAX_PATH_COMPLETIONS
+        plen = len(prefix)
+        start = bisect.bisect_left(entries, prefix, key=itemgetter(0)) if plen else 0
+        for name, is_dir in entries[start:]:
+            if name[:plen] != prefix:
+                break
+            if not show_hidden and name[:1] == ".":
+                continue
+
+            if is_dir:
+                completion_text = f"{base}{name}/"
+                display = f"{name}/"
+            else:
+                completion_text = base + name
+                display = name
+
+            yield Completion(
+                completion_text,
+                start_position=start_pos,
+                display=display,
+                display_meta="dir" if is_dir else "",
+            )
+
+            remaining -= 1
+            if not remaining:
+                return
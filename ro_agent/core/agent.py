@@ -1,21 +1,38 @@
 """Core agent loop for ro-agent."""
 
 import asyncio
+import json
+import logging
 from collections.abc import AsyncIterator, Callable, Awaitable
 from dataclasses import dataclass
 from typing import Any
 
-from ..client.model import ModelClient, Prompt, Message
+from ..client.model import ModelClient, Prompt
 from ..tools.base import ToolInvocation
 from ..tools.registry import ToolRegistry
 from .session import Session, ToolResult
 
+logger = logging.getLogger(__name__)
+
 # Max characters to store in history per tool result (roughly 5-8k tokens)
 MAX_TOOL_OUTPUT_CHARS = 20000
 
 # Auto-compaction triggers at this fraction of the model's context window
 AUTO_COMPACT_THRESHOLD = 0.7
 
+# Auto-compaction first shrinks oversized tool results outside the first and
+# last few messages to this size, and only summarizes if that isn't enough
+COMPACT_KEEP_FIRST = 5
+COMPACT_KEEP_LAST = 5
+COMPACT_TOOL_OUTPUT_CHARS = 2000
+
+# Share of the context window the compaction transcript may use (at ~4 chars
+# per token), so the summarization request itself can't overflow
+COMPACT_INPUT_BUDGET = 0.5
+
+# Seconds between polls of an external cancel_check during a turn
+CANCEL_POLL_INTERVAL = 0.1
+
 # Compaction prompts (following Codex/Claude Code patterns)
 COMPACTION_SYSTEM_PROMPT = """\
 You are performing a CONTEXT CHECKPOINT COMPACTION. Create a handoff summary for another LLM that will resume the task.
@@ -50,11 +67,37 @@ def truncate_output(content: str, max_chars: int = MAX_TOOL_OUTPUT_CHARS) -> str
         return content
     half = max_chars // 2
     elided = len(content) - max_chars
-    return (
-        content[:half]
-        + f"\n\n[... {elided} chars elided ...]\n\n"
-        + content[-half:]
-    )
+    return f"{content[:half]}\n\n[... {elided} chars elided ...]\n\n{content[-half:]}"
+
+
+def _format_user(msg: dict[str, Any], append: Callable[[str], None]) -> None:
+    """Append a user message's transcript line."""
+    append(f"User: {msg.get('content')}")
+
+
+def _format_assistant(msg: dict[str, Any], append: Callable[[str], None]) -> None:
+    """Append an assistant message's text and tool-call lines."""
+    if content := msg.get("content"):
+        append(f"Assistant: {content}")
+    for tc in msg.get("tool_calls") or ():
+        func = tc.get("function", {})
+        append(f"Assistant called tool: {func.get('name', 'unknown')}")
+
+
+def _format_tool(msg: dict[str, Any], append: Callable[[str], None]) -> None:
+    """Append a tool result, summarized briefly."""
+    result = msg.get("content") or ""
+    if len(result) > 500:
+        result = result[:500] + "..."
+    append(f"Tool result: {result}")
+
+
+# Transcript formatters for _format_history_for_summary, by message role
+_ROLE_FORMATTERS: dict[str, Callable[[dict[str, Any], Callable[[str], None]], None]] = {
+    "user": _format_user,
+    "assistant": _format_assistant,
+    "tool": _format_tool,
+}
 
 
 @dataclass
@@ -106,30 +149,54 @@ class Agent:
         self._client = client or ModelClient()
         self._approval_callback = approval_callback
         self._context_window = context_window
+        # Token count above which auto-compaction kicks in
+        self._compact_threshold = (
+            int(context_window * AUTO_COMPACT_THRESHOLD) if context_window is not None else None
+        )
         self._auto_compact = auto_compact
-        self._cancel_requested = False
+        self._cancel_event = asyncio.Event()
         self._cancel_check = cancel_check
 
     def request_cancel(self) -> None:
         """Request cancellation of the current turn."""
-        self._cancel_requested = True
+        self._cancel_event.set()
 
     def _reset_cancel(self) -> None:
         """Reset cancellation state for a new turn."""
-        self._cancel_requested = False
+        self._cancel_event.clear()
 
     def is_cancelled(self) -> bool:
         """Check if cancellation has been requested.
 
-        Checks both the in-process flag (set by request_cancel) and the
+        Set by request_cancel, or during a turn by the watcher polling the
         optional external cancel_check callback (e.g., file-based signal).
         """
-        if self._cancel_requested:
-            return True
-        if self._cancel_check is not None and self._cancel_check():
-            self._cancel_requested = True  # latch so subsequent checks are fast
-            return True
-        return False
+        return self._cancel_event.is_set()
+
+    async def aclose(self) -> None:
+        """Release the model client's connections."""
+        await self._client.aclose()
+
+    async def _watch_cancel_check(self) -> None:
+        """Poll cancel_check until it fires, then set the cancel event.
+
+        Polling on a timer keeps the callback (often a stat() syscall) off
+        the per-token streaming path. A callback that raises is logged and
+        polled again, so a transient failure doesn't silently end the watch.
+        """
+        failing = False
+        while not self._cancel_event.is_set():
+            await asyncio.sleep(CANCEL_POLL_INTERVAL)
+            try:
+                cancelled = self._cancel_check()
+            except Exception:
+                if not failing:  # Log once per run of failures
+                    logger.exception("cancel_check raised; still polling")
+                failing = True
+                continue
+            failing = False
+            if cancelled:
+                self._cancel_event.set()
 
     async def compact(
         self, custom_instructions: str = "", trigger: str = "manual"
@@ -145,13 +212,29 @@ class Agent:
         """
         tokens_before = self._session.estimate_tokens()
 
+        # Level 1 (auto only): trim old tool output in place, no model call
+        if trigger == "auto" and self._compact_threshold is not None:
+            trimmed = self._trim_tool_results()
+            tokens_after = self._session.estimate_tokens()
+            if trimmed and tokens_after <= self._compact_threshold:
+                return CompactResult(
+                    summary=f"Trimmed {trimmed} oversized tool results",
+                    tokens_before=tokens_before,
+                    tokens_after=tokens_after,
+                    trigger=trigger,
+                )
+
+        # Level 2: summarize the whole conversation
         # Build the summarization prompt
         system = COMPACTION_SYSTEM_PROMPT
         if custom_instructions:
             system += f"\n\nUser guidance: {custom_instructions}"
 
         # Build conversation content for summarization
-        conversation_text = self._format_history_for_summary()
+        max_chars = None
+        if self._context_window is not None:
+            max_chars = int(self._context_window * COMPACT_INPUT_BUDGET) * 4
+        conversation_text = self._format_history_for_summary(max_chars)
 
         messages = [
             {"role": "system", "content": system},
@@ -187,41 +270,62 @@ class Agent:
             trigger=trigger,
         )
 
-    def _format_history_for_summary(self) -> str:
-        """Format conversation history as text for summarization."""
-        parts = []
-        for msg in self._session.get_messages():
-            role = msg.get("role", "unknown")
+    def _trim_tool_results(self) -> int:
+        """Shrink oversized tool results in the middle of history.
+
+        Returns the number of results trimmed.
+        """
+        history = self._session.history
+        trimmed = 0
+        for i in range(COMPACT_KEEP_FIRST, len(history) - COMPACT_KEEP_LAST):
+            msg = history[i]
             content = msg.get("content")
+            if (
+                msg.get("role") == "tool"
+                and isinstance(content, str)
+                and len(content) > COMPACT_TOOL_OUTPUT_CHARS
+            ):
+                self._session.set_message_content(
+                    i, truncate_output(content, COMPACT_TOOL_OUTPUT_CHARS)
+                )
+                trimmed += 1
+        return trimmed
 
-            if role == "user":
-                parts.append(f"User: {content}")
-            elif role == "assistant":
-                if content:
-                    parts.append(f"Assistant: {content}")
-                if msg.get("tool_calls"):
-                    for tc in msg["tool_calls"]:
-                        func = tc.get("function", {})
-                        parts.append(
-                            f"Assistant called tool: {func.get('name', 'unknown')}"
-                        )
-            elif role == "tool":
-                # Summarize tool results briefly
-                result = content or ""
-                if len(result) > 500:
-                    result = result[:500] + "..."
-                parts.append(f"Tool result: {result}")
+    def _format_history_for_summary(self, max_chars: int | None = None) -> str:
+        """Format conversation history as text for summarization.
+
+        If max_chars is given, the oldest entries are dropped until the
+        transcript fits, since the most recent context matters most for
+        the handoff.
+        """
+        parts: list[str] = []
+        append = parts.append
+        # Read-only walk, so no need for get_messages()'s copy
+        formatters = _ROLE_FORMATTERS
+        for msg in self._session.history:
+            formatter = formatters.get(msg.get("role"))
+            if formatter is not None:
+                formatter(msg, append)
+
+        if max_chars is not None:
+            # Keep the newest parts that fit (2 chars per separator)
+            used = 0
+            start = len(parts)
+            while start and used + len(parts[start - 1]) + 2 <= max_chars:
+                start -= 1
+                used += len(parts[start]) + 2
+            if start:
+                parts = [f"[... {start} earlier entries omitted ...]", *parts[start:]]
 
         return "\n\n".join(parts)
 
     def should_auto_compact(self) -> bool:
         """Check if auto-compaction should be triggered."""
-        if not self._auto_compact or self._context_window is None:
+        if not self._auto_compact or self._compact_threshold is None:
             return False
         # Prefer actual token count from last API call over heuristic estimate
         token_count = self._session.last_input_tokens or self._session.estimate_tokens()
-        threshold = int(self._context_window * AUTO_COMPACT_THRESHOLD)
-        return token_count > threshold
+        return token_count > self._compact_threshold
 
     async def run_turn(self, user_input: str) -> AsyncIterator[AgentEvent]:
         """Run a single conversation turn.
@@ -230,7 +334,21 @@ class Agent:
         Yields AgentEvent(type="cancelled") if cancellation is requested.
         """
         self._reset_cancel()
-
+        watcher = None
+        if self._cancel_check is not None:
+            if self._cancel_check():
+                self._cancel_event.set()
+            else:
+                watcher = asyncio.create_task(self._watch_cancel_check())
+        try:
+            async for event in self._run_turn(user_input):
+                yield event
+        finally:
+            if watcher is not None:
+                watcher.cancel()
+
+    async def _run_turn(self, user_input: str) -> AsyncIterator[AgentEvent]:
+        """Run the turn's model/tool loop; see run_turn."""
         # Check if auto-compaction is needed before processing
         if self.should_auto_compact():
             yield AgentEvent(type="compact_start", content="auto")
@@ -259,23 +377,17 @@ class Agent:
                     content=f"Compacted: {result.tokens_before} → {result.tokens_after} tokens",
                 )
 
-            # Build prompt
+            # Build prompt. History is passed by reference (it is not
+            # modified while the model streams); the client copies it into
+            # the request's message list.
             prompt = Prompt(
                 system=self._session.system_prompt,
-                messages=[
-                    Message(
-                        role=m["role"],
-                        content=m.get("content"),
-                        tool_calls=m.get("tool_calls"),
-                        tool_call_id=m.get("tool_call_id"),
-                    )
-                    for m in self._session.get_messages()
-                ],
+                messages=self._session.history,
                 tools=self._registry.get_specs(),
             )
 
             # Track what we get in this turn
-            text_content = ""
+            text_parts: list[str] = []
             tool_calls: list[dict[str, Any]] = []
             pending_tool_calls: list[
                 tuple[str, str, dict[str, Any]]
@@ -289,7 +401,8 @@ class Agent:
                     return
 
                 if event.type == "text":
-                    text_content += event.content or ""
+                    if event.content:
+                        text_parts.append(event.content)
                     yield AgentEvent(type="text", content=event.content)
 
                 elif event.type == "tool_call":
@@ -307,7 +420,7 @@ class Agent:
                                 "type": "function",
                                 "function": {
                                     "name": tc.name,
-                                    "arguments": __import__("json").dumps(tc.arguments),
+                                    "arguments": json.dumps(tc.arguments, separators=(",", ":")),
                                 },
                             }
                         )
@@ -327,8 +440,8 @@ class Agent:
             # Record what the assistant said/did
             if tool_calls:
                 self._session.add_assistant_tool_calls(tool_calls)
-            elif text_content:
-                self._session.add_assistant_message(text_content)
+            elif text_parts:
+                self._session.add_assistant_message("".join(text_parts))
 
             # If no tool calls, we're done
             if not pending_tool_calls:
@@ -344,16 +457,17 @@ class Agent:
             # Execute tool calls
             tool_results: list[ToolResult] = []
             rejected = False
-            for tool_id, tool_name, tool_args in pending_tool_calls:
+            i = 0
+            while i < len(pending_tool_calls):
+                tool_id, tool_name, tool_args = pending_tool_calls[i]
                 # Check for cancellation before each tool
                 if self.is_cancelled():
                     yield AgentEvent(type="cancelled", content="Cancelled before tool execution")
                     return
 
                 # Check approval if callback is set and tool requires it
-                if self._approval_callback and self._registry.requires_approval(
-                    tool_name
-                ):
+                needs_approval = self._registry.requires_approval(tool_name)
+                if self._approval_callback and needs_approval:
                     approved = await self._approval_callback(tool_name, tool_args)
                     if not approved:
                         # Must add result to keep API happy, then end turn
@@ -370,10 +484,7 @@ class Agent:
                         )
                         rejected = True
                         # Add dummy results for remaining tool calls
-                        for remaining_id, _, _ in pending_tool_calls[
-                            pending_tool_calls.index((tool_id, tool_name, tool_args))
-                            + 1 :
-                        ]:
+                        for remaining_id, _, _ in pending_tool_calls[i + 1 :]:
                             tool_results.append(
                                 ToolResult(
                                     tool_call_id=remaining_id,
@@ -382,26 +493,42 @@ class Agent:
                             )
                         break
 
-                invocation = ToolInvocation(
-                    call_id=tool_id,
-                    tool_name=tool_name,
-                    arguments=tool_args,
-                )
-                output = await self._registry.dispatch(invocation)
-                # Truncate output to prevent context overflow
-                truncated_content = truncate_output(output.content)
-                tool_results.append(
-                    ToolResult(
-                        tool_call_id=tool_id,
-                        content=truncated_content,
+                # Run consecutive side-effect-free calls concurrently; the
+                # rest run one at a time in the order the model gave them
+                end = i + 1
+                if self._registry.parallel_safe(tool_name) and not needs_approval:
+                    while end < len(pending_tool_calls):
+                        next_name = pending_tool_calls[end][1]
+                        if not self._registry.parallel_safe(
+                            next_name
+                        ) or self._registry.requires_approval(next_name):
+                            break
+                        end += 1
+                batch = pending_tool_calls[i:end]
+                outputs = await asyncio.gather(
+                    *(
+                        self._registry.dispatch(
+                            ToolInvocation(call_id=call_id, tool_name=name, arguments=args)
+                        )
+                        for call_id, name, args in batch
                     )
                 )
-                yield AgentEvent(
-                    type="tool_end",
-                    tool_name=tool_name,
-                    tool_result=truncated_content,
-                    tool_metadata=output.metadata,
-                )
+                for (call_id, name, _), output in zip(batch, outputs):
+                    # Truncate output to prevent context overflow
+                    truncated_content = truncate_output(output.content)
+                    tool_results.append(
+                        ToolResult(
+                            tool_call_id=call_id,
+                            content=truncated_content,
+                        )
+                    )
+                    yield AgentEvent(
+                        type="tool_end",
+                        tool_name=name,
+                        tool_result=truncated_content,
+                        tool_metadata=output.metadata,
+                    )
+                i = end
 
             # Add tool results to history
             self._session.add_tool_results(tool_results)
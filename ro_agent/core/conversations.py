@@ -6,6 +6,46 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Sidecar file holding a conversation's listing metadata, so listing
+# doesn't have to parse full histories
+META_SUFFIX = ".meta.json"
+
+# Chars of the first user message kept in the sidecar
+META_PREVIEW_CHARS = 120
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write JSON with 2-space indent, using orjson when available."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _read_json(path: Path) -> Any:
+    """Read JSON, using orjson when available.
+
+    orjson's decode error subclasses json.JSONDecodeError.
+    """
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _first_user_message(history: list[dict[str, Any]]) -> str:
+    """Get the first user message's preview text."""
+    for msg in history:
+        if msg.get("role") == "user" and msg.get("content"):
+            return msg["content"][:META_PREVIEW_CHARS]
+    return ""
+
 
 @dataclass
 class ConversationMetadata:
@@ -69,8 +109,22 @@ class ConversationStore:
         self.conversations_dir.mkdir(parents=True, exist_ok=True)
 
     def _generate_id(self) -> str:
-        """Generate a conversation ID from current timestamp."""
-        return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        """Generate a conversation ID from current timestamp.
+
+        The ID is claimed by creating its file exclusively, so conversations
+        saved in the same second (e.g. parallel eval runs) get _2, _3, ...
+        suffixes instead of overwriting each other.
+        """
+        base = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        conv_id = base
+        n = 1
+        while True:
+            try:
+                (self.conversations_dir / f"{conv_id}.json").touch(exist_ok=False)
+                return conv_id
+            except FileExistsError:
+                n += 1
+                conv_id = f"{base}_{n}"
 
     def save(
         self,
@@ -98,8 +152,19 @@ class ConversationStore:
         )
 
         file_path = self.conversations_dir / f"{conv_id}.json"
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(conversation.to_dict(), f, indent=2, ensure_ascii=False)
+        _write_json(file_path, conversation.to_dict())
+
+        metadata = ConversationMetadata(
+            id=conv_id,
+            model=model,
+            started=conversation.started,
+            ended=conversation.ended,
+            message_count=len(history),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            first_user_message=_first_user_message(history),
+        )
+        _write_json(self.conversations_dir / f"{conv_id}{META_SUFFIX}", asdict(metadata))
 
         return file_path
 
@@ -109,46 +174,51 @@ class ConversationStore:
         if not file_path.exists():
             return None
 
-        with open(file_path, encoding="utf-8") as f:
-            data = json.load(f)
-
-        return Conversation.from_dict(data)
+        return Conversation.from_dict(_read_json(file_path))
 
     def list_conversations(self, limit: int = 20) -> list[ConversationMetadata]:
         """List recent conversations, newest first."""
         files = sorted(
-            self.conversations_dir.glob("*.json"),
+            (
+                p
+                for p in self.conversations_dir.glob("*.json")
+                if not p.name.endswith(META_SUFFIX)
+            ),
             key=lambda p: p.stat().st_mtime,
             reverse=True,
         )[:limit]
 
         results = []
         for file_path in files:
+            meta_path = file_path.with_name(file_path.stem + META_SUFFIX)
             try:
-                with open(file_path, encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Find first user message for preview
-                first_user = ""
-                for msg in data.get("history", []):
-                    if msg.get("role") == "user" and msg.get("content"):
-                        first_user = msg["content"]
-                        break
-
-                results.append(
-                    ConversationMetadata(
-                        id=data["id"],
-                        model=data.get("model", "unknown"),
-                        started=data.get("started", ""),
-                        ended=data.get("ended", ""),
-                        message_count=len(data.get("history", [])),
-                        input_tokens=data.get("input_tokens", 0),
-                        output_tokens=data.get("output_tokens", 0),
-                        first_user_message=first_user,
-                    )
+                results.append(ConversationMetadata(**_read_json(meta_path)))
+                continue
+            except (OSError, ValueError, TypeError):
+                pass  # Saved before sidecars existed, or unreadable
+
+            try:
+                data = _read_json(file_path)
+                history = data.get("history", [])
+                metadata = ConversationMetadata(
+                    id=data["id"],
+                    model=data.get("model", "unknown"),
+                    started=data.get("started", ""),
+                    ended=data.get("ended", ""),
+                    message_count=len(history),
+                    input_tokens=data.get("input_tokens", 0),
+                    output_tokens=data.get("output_tokens", 0),
+                    first_user_message=_first_user_message(history),
                 )
             except (json.JSONDecodeError, KeyError):
                 continue
+            results.append(metadata)
+
+            # Backfill the sidecar so this file is only parsed in full once
+            try:
+                _write_json(meta_path, asdict(metadata))
+            except OSError:
+                pass
 
         return results
 
@@ -1,11 +1,38 @@
 """Session management for conversation history."""
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, NamedTuple
 
 
-@dataclass
-class ToolResult:
+def _text_chars(text: str) -> int:
+    """Length of text weighted for tokenization, in ASCII-char units.
+
+    Tokenizers spend roughly a token per CJK character rather than per ~4
+    ASCII chars, so non-ASCII text is weighted by its extra UTF-8 bytes:
+    a 3-byte CJK char counts as 4, a 2-byte accented letter as 2.
+    """
+    if text.isascii():  # O(1) for str
+        return len(text)
+    n = len(text)
+    return n + (len(text.encode("utf-8")) - n) * 3 // 2
+
+
+def _message_chars(m: dict[str, Any]) -> int:
+    """Count the characters a history message contributes to the context."""
+    n = 0
+    content = m.get("content")
+    if isinstance(content, str):
+        n += _text_chars(content)
+    elif isinstance(content, list):
+        n += sum(len(str(c)) for c in content)
+    # Tool calls: count what the model sees, the name and JSON arguments
+    for tc in m.get("tool_calls") or ():
+        func = tc.get("function", {})
+        n += len(func.get("name", "")) + _text_chars(func.get("arguments", ""))
+    return n
+
+
+class ToolResult(NamedTuple):
     """Result of a tool call to include in history."""
 
     tool_call_id: str
@@ -24,6 +51,21 @@ class Session:
     total_input_tokens: int = 0
     total_output_tokens: int = 0
     last_input_tokens: int = 0  # Context size of most recent API call
+    # Derived state for the first _counted_messages entries of
+    # _counted_history (see _sync), so queries only scan messages added since
+    _char_total: int = field(default=0, init=False, repr=False, compare=False)
+    _user_messages: list[str] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _counted_messages: int = field(default=0, init=False, repr=False, compare=False)
+    _counted_history: list[dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Weighted length of system_prompt, for the prompt object it was taken of
+    _system_chars: int = field(default=0, init=False, repr=False, compare=False)
+    _system_counted: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add_user_message(self, content: str) -> None:
         """Add a user message to history."""
@@ -55,15 +97,31 @@ class Session:
 
     def add_tool_results(self, results: list[ToolResult]) -> None:
         """Add tool results as tool messages."""
-        for r in results:
+        for tool_call_id, content in results:
             self.history.append(
                 {
                     "role": "tool",
-                    "tool_call_id": r.tool_call_id,
-                    "content": r.content,
+                    "tool_call_id": tool_call_id,
+                    "content": content,
                 }
             )
 
+    def set_message_content(self, index: int, content: str) -> None:
+        """Replace the content of a message already in history.
+
+        Used to shrink old messages during compaction. The message dict is
+        replaced rather than mutated, since copies of history may share it.
+        """
+        old = self.history[index]
+        new = {**old, "content": content}
+        self.history[index] = new
+        if old.get("role") == "user":
+            self._counted_history = None  # Recount user messages too
+        elif self.history is self._counted_history and index < self._counted_messages:
+            self._char_total += _message_chars(new) - _message_chars(old)
+        # The last API call's context size no longer reflects history
+        self.last_input_tokens = 0
+
     def update_token_usage(self, input_tokens: int, output_tokens: int) -> None:
         """Update cumulative token usage."""
         self.total_input_tokens += input_tokens
@@ -78,6 +136,7 @@ class Session:
     def clear(self) -> None:
         """Clear conversation history."""
         self.history.clear()
+        self._counted_history = None
 
     def replace_with_summary(
         self, summary: str, recent_user_messages: list[str] | None = None
@@ -89,6 +148,7 @@ class Session:
             recent_user_messages: Optional list of recent user messages to preserve.
         """
         self.history.clear()
+        self._counted_history = None
 
         # Add recent user messages if provided
         if recent_user_messages:
@@ -98,24 +158,36 @@ class Session:
         # Add the summary as a user message (following Codex pattern)
         self.history.append({"role": "user", "content": summary})
 
+    def _sync(self) -> None:
+        """Update derived state for messages added since the last call.
+
+        History is append-only between clear() and replace_with_summary(),
+        so each message is scanned once; a reassigned history list is
+        rescanned from scratch.
+        """
+        history = self.history
+        if history is self._counted_history and len(history) == self._counted_messages:
+            return  # Nothing added since the last call
+        if history is not self._counted_history or len(history) < self._counted_messages:
+            self._counted_history = history
+            self._char_total = 0
+            self._user_messages = []
+            self._counted_messages = 0
+        for m in history[self._counted_messages :]:
+            self._char_total += _message_chars(m)
+            if m.get("role") == "user" and m.get("content"):
+                self._user_messages.append(m["content"])
+        self._counted_messages = len(history)
+
     def get_user_messages(self) -> list[str]:
         """Extract all user messages from history."""
-        return [
-            m["content"]
-            for m in self.history
-            if m.get("role") == "user" and m.get("content")
-        ]
+        self._sync()
+        return self._user_messages.copy()
 
     def estimate_tokens(self) -> int:
         """Rough estimate of tokens in history (4 chars ≈ 1 token)."""
-        total_chars = len(self.system_prompt)
-        for m in self.history:
-            content = m.get("content")
-            if isinstance(content, str):
-                total_chars += len(content)
-            elif isinstance(content, list):
-                total_chars += sum(len(str(c)) for c in content)
-            # Tool calls
-            if m.get("tool_calls"):
-                total_chars += len(str(m["tool_calls"]))
-        return total_chars // 4
+        self._sync()
+        if self.system_prompt is not self._system_counted:
+            self._system_counted = self.system_prompt
+            self._system_chars = _text_chars(self.system_prompt)
+        return (self._system_chars + self._char_total) // 4
@@ -4,7 +4,21 @@ This module provides tools for running AgentBench's DB Bench and OS Interaction
 tasks through ro-agent's harness.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .config import EvalConfig, TaskResult, TaskStatus
-from .runner import EvalRunner
+
+if TYPE_CHECKING:
+    from .runner import EvalRunner
 
 __all__ = ["EvalConfig", "TaskResult", "TaskStatus", "EvalRunner"]
+
+
+def __getattr__(name: str) -> Any:
+    # The runner pulls in the agent and model client, so it is only
+    # imported when used; the eval CLI's --help doesn't need it
+    if name == "EvalRunner":
+        from .runner import EvalRunner
+
+        return EvalRunner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,7 +8,7 @@ import json
 import os
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Required, TypedDict
 
 from cerebras.cloud.sdk import AsyncCerebras
 
@@ -33,14 +33,13 @@ class StreamEvent:
     usage: dict[str, int] | None = None
 
 
-@dataclass
-class Message:
-    """A message in the conversation."""
+class Message(TypedDict, total=False):
+    """A message in the conversation, in OpenAI's API format."""
 
-    role: str  # "user", "assistant", "system", "tool"
-    content: str | list[dict[str, Any]] | None = None
-    tool_calls: list[dict[str, Any]] | None = None
-    tool_call_id: str | None = None
+    role: Required[str]  # "user", "assistant", "system", "tool"
+    content: str | list[dict[str, Any]] | None
+    tool_calls: list[dict[str, Any]]
+    tool_call_id: str
 
 
 @dataclass
@@ -92,17 +91,7 @@ class CerebrasClient:
 
     def _build_messages(self, prompt: Prompt) -> list[dict[str, Any]]:
         """Build messages list from prompt."""
-        messages: list[dict[str, Any]] = [{"role": "system", "content": prompt.system}]
-        for msg in prompt.messages:
-            m: dict[str, Any] = {"role": msg.role}
-            if msg.content is not None:
-                m["content"] = msg.content
-            if msg.tool_calls:
-                m["tool_calls"] = msg.tool_calls
-            if msg.tool_call_id:
-                m["tool_call_id"] = msg.tool_call_id
-            messages.append(m)
-        return messages
+        return [{"role": "system", "content": prompt.system}, *prompt.messages]
 
     async def stream(self, prompt: Prompt) -> AsyncIterator[StreamEvent]:
         """Non-streaming completion that yields StreamEvents.
@@ -176,3 +165,7 @@ class CerebrasClient:
             return content, usage
         except Exception as e:
             return f"Error: {e}", {"input_tokens": 0, "output_tokens": 0}
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.close()
@@ -2,8 +2,12 @@
 
 import asyncio
 import os
+import time
+from collections.abc import Callable, Coroutine, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Annotated, Any, Optional, TypeVar
 
 from dotenv import load_dotenv
 
@@ -19,7 +23,6 @@ def _default_output_dir(model: str, task_type: str) -> Path:
 
 import typer  # noqa: E402
 from rich.console import Console  # noqa: E402
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn  # noqa: E402
 
 from .config import EvalAbortedError, EvalConfig  # noqa: E402
 from .output import (  # noqa: E402
@@ -30,12 +33,81 @@ from .output import (  # noqa: E402
     save_run_config,
     update_overall,
 )
-from .runner import EvalRunner  # noqa: E402
-from .tasks.dbbench import load_dbbench_tasks  # noqa: E402
-from .tasks.os_interaction import load_os_tasks, load_os_benchmark  # noqa: E402
+from .tasks.base import BaseTask  # noqa: E402
 
 console = Console()
 
+T = TypeVar("T")
+TaskT = TypeVar("TaskT", bound=BaseTask)
+
+# Minimum seconds between progress bar redraws
+PROGRESS_UPDATE_INTERVAL = 0.1
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop that starts new tasks eagerly.
+
+    Eager tasks run synchronously until they first block, so the many
+    short-lived tasks an eval creates (per-task runs, container starts)
+    skip a trip through the scheduler when they can finish right away.
+    """
+    loop = asyncio.new_event_loop()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
+def _select_tasks(
+    tasks: Iterable[TaskT],
+    offset: int,
+    limit: int | None,
+    completed: set[int],
+    keep: Callable[[TaskT], bool] | None = None,
+) -> list[TaskT]:
+    """Filter tasks, apply --offset/--limit, and skip completed ones in one pass.
+
+    The offset/limit window applies after `keep`, and completed tasks are
+    dropped from within the window, so a resumed run covers the same tasks.
+    """
+    selected = tasks if keep is None else filter(keep, tasks)
+    start = max(offset, 0)
+    stop = None if limit is None else start + max(limit, 0)
+    return [t for t in islice(selected, start, stop) if t.index not in completed]
+
+
+def _progress_updater(progress: Any, task_id: Any) -> Callable[[int, int], None]:
+    """Build a progress callback that redraws at most every PROGRESS_UPDATE_INTERVAL.
+
+    At high --parallel tasks finish in bursts, and each rich update takes
+    the progress lock and re-renders. The final task always gets through.
+    """
+    last = 0.0
+
+    def update_progress(completed: int, total: int) -> None:
+        nonlocal last
+        now = time.monotonic()
+        if completed == total or now - last >= PROGRESS_UPDATE_INTERVAL:
+            progress.update(task_id, completed=completed)
+            last = now
+
+    return update_progress
+
+
+def _run(coro: Coroutine[Any, Any, T], parallel: int = 1) -> T:
+    """Run an evaluation coroutine to completion on a fresh event loop.
+
+    The loop's default executor is sized to the task parallelism: each
+    task's model client resolves its API host there when it connects, and
+    the stock pool (cpu count + 4) would queue those at high --parallel.
+    The runner shuts the executor down when it closes the loop.
+    """
+    executor = ThreadPoolExecutor(
+        max_workers=max(parallel * 2, 8), thread_name_prefix="ro-eval"
+    )
+    with asyncio.Runner(loop_factory=_new_event_loop) as runner:
+        runner.get_loop().set_default_executor(executor)
+        return runner.run(coro)
+
+
 app = typer.Typer(
     name="ro-eval",
     help="Run AgentBench evaluations through ro-agent.",
@@ -99,33 +171,38 @@ def dbbench(
     ] = None,
 ) -> None:
     """Run DBBench evaluation tasks."""
+    # Deferred so --help doesn't load the agent and model client
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+
+    from .runner import EvalRunner
+    from .tasks.dbbench import load_dbbench_tasks
+
     # Load tasks
     console.print(f"Loading tasks from {data_file}...")
     tasks = load_dbbench_tasks(data_file)
     console.print(f"Loaded {len(tasks)} tasks")
 
     # Filter to SELECT-only if requested
+    keep = (lambda t: t.query_type == "SELECT") if select_only else None
     if select_only:
-        original_count = len(tasks)
-        tasks = [t for t in tasks if t.query_type == "SELECT"]
-        console.print(f"Filtered to {len(tasks)} SELECT queries (skipped {original_count - len(tasks)} mutation tasks)")
-
-    # Apply offset and limit
-    if offset > 0:
-        tasks = tasks[offset:]
-    if limit is not None:
-        tasks = tasks[:limit]
+        select_count = sum(t.query_type == "SELECT" for t in tasks)
+        console.print(f"Filtered to {select_count} SELECT queries (skipped {len(tasks) - select_count} mutation tasks)")
 
-    # Determine output directory
+    # Completed tasks are skipped in the same pass as the filters
+    completed: set[int] = set()
     if resume:
-        # Resume mode - use existing run directory
         run_dir = Path(resume)
         if not run_dir.exists():
             console.print(f"[red]Error: Run directory not found: {resume}[/red]")
             raise typer.Exit(1)
         completed = get_completed_indices(run_dir)
-        original_count = len(tasks)
-        tasks = [t for t in tasks if t.index not in completed]
+
+    # Apply filter, offset and limit
+    tasks = _select_tasks(tasks, offset, limit, completed, keep)
+
+    # Determine output directory
+    if resume:
+        # Resume mode - use existing run directory
         console.print(f"Resuming run: {run_dir}")
         console.print(f"Already completed: {len(completed)} tasks, {len(tasks)} remaining")
     else:
@@ -179,14 +256,13 @@ def dbbench(
         console=console,
     ) as progress:
         task_id = progress.add_task("Running DBBench...", total=len(tasks))
-
-        def update_progress(completed: int, total: int) -> None:
-            progress.update(task_id, completed=completed)
+        update_progress = _progress_updater(progress, task_id)
 
         # Run evaluation (results saved incrementally)
         try:
-            results, metrics = asyncio.run(
-                runner.run_dbbench_tasks(tasks, output_dir=run_dir, progress_callback=update_progress)
+            results, metrics = _run(
+                runner.run_dbbench_tasks(tasks, output_dir=run_dir, progress_callback=update_progress),
+                parallel=parallel,
             )
         except EvalAbortedError as e:
             console.print()
@@ -274,6 +350,12 @@ def os_interaction(
         # Resume an interrupted run
         ro-eval os-interaction ~/proj/AgentBench/data/os_interaction --resume results/gpt-5-mini-os/run-20260121-173000
     """
+    # Deferred so --help doesn't load the agent and model client
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+
+    from .runner import EvalRunner
+    from .tasks.os_interaction import load_os_tasks, load_os_benchmark
+
     # Load tasks - detect if path is a directory or file
     input_path = Path(data_path)
 
@@ -288,22 +370,21 @@ def os_interaction(
         tasks = load_os_tasks(data_path, scripts_dir=scripts)
         console.print(f"Loaded {len(tasks)} tasks")
 
-    # Apply offset and limit
-    if offset > 0:
-        tasks = tasks[offset:]
-    if limit is not None:
-        tasks = tasks[:limit]
-
-    # Determine output directory
+    # Completed tasks are skipped in the same pass as offset and limit
+    completed: set[int] = set()
     if resume:
-        # Resume mode - use existing run directory
         run_dir = Path(resume)
         if not run_dir.exists():
             console.print(f"[red]Error: Run directory not found: {resume}[/red]")
             raise typer.Exit(1)
         completed = get_completed_indices(run_dir)
-        original_count = len(tasks)
-        tasks = [t for t in tasks if t.index not in completed]
+
+    # Apply offset and limit
+    tasks = _select_tasks(tasks, offset, limit, completed)
+
+    # Determine output directory
+    if resume:
+        # Resume mode - use existing run directory
         console.print(f"Resuming run: {run_dir}")
         console.print(f"Already completed: {len(completed)} tasks, {len(tasks)} remaining")
     else:
@@ -357,14 +438,13 @@ def os_interaction(
         console=console,
     ) as progress:
         task_id = progress.add_task("Running OS tasks...", total=len(tasks))
-
-        def update_progress(completed: int, total: int) -> None:
-            progress.update(task_id, completed=completed)
+        update_progress = _progress_updater(progress, task_id)
 
         # Run evaluation (results saved incrementally)
         try:
-            results, metrics = asyncio.run(
-                runner.run_os_tasks(tasks, output_dir=run_dir, progress_callback=update_progress)
+            results, metrics = _run(
+                runner.run_os_tasks(tasks, output_dir=run_dir, progress_callback=update_progress),
+                parallel=parallel,
             )
         except EvalAbortedError as e:
             console.print()
@@ -1,7 +1,7 @@
 """Configuration and result dataclasses for evaluation."""
 
-from dataclasses import dataclass, field
-from datetime import datetime
+import time
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
@@ -18,6 +18,18 @@ class TaskStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
+# EvalMetrics counter for each status; anything else counts as unknown.
+# TaskStatus is a str enum, so raw status strings from runs.jsonl match too.
+_STATUS_COUNTERS: dict[str, str] = {
+    TaskStatus.COMPLETED: "completed",
+    TaskStatus.AGENT_CONTEXT_LIMIT: "context_limit",
+    TaskStatus.AGENT_VALIDATION_FAILED: "validation_failed",
+    TaskStatus.AGENT_INVALID_ACTION: "invalid_action",
+    TaskStatus.TASK_LIMIT_REACHED: "task_limit_reached",
+    TaskStatus.TASK_ERROR: "task_error",
+}
+
+
 class EvalAbortedError(Exception):
     """Raised when evaluation is aborted due to consecutive errors."""
 
@@ -26,7 +38,7 @@ class EvalAbortedError(Exception):
         self.consecutive_errors = consecutive_errors
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalConfig:
     """Configuration for running evaluations."""
 
@@ -41,7 +53,7 @@ class EvalConfig:
     service_tier: str | None = None  # OpenAI service tier: "flex", "auto", or None
 
 
-@dataclass
+@dataclass(slots=True)
 class DBBenchResult:
     """Result of a DBBench task evaluation."""
 
@@ -52,14 +64,14 @@ class DBBenchResult:
     type: str  # SELECT, INSERT, UPDATE, DELETE
 
 
-@dataclass
+@dataclass(slots=True)
 class OSResult:
     """Result of an OS interaction task evaluation."""
 
     result: bool  # True if correct
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Result of a single task execution."""
 
@@ -96,14 +108,14 @@ class TaskResult:
     @staticmethod
     def create_time() -> dict[str, Any]:
         """Create a time dictionary for the current time."""
-        now = datetime.now()
+        timestamp = int(time.time())
         return {
-            "timestamp": int(now.timestamp()),
-            "str": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": timestamp,
+            "str": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp)),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalMetrics:
     """Aggregate metrics for an evaluation run."""
 
@@ -120,8 +132,11 @@ class EvalMetrics:
     task_error: int = 0
     unknown: int = 0
 
-    # History stats
-    history_lengths: list[int] = field(default_factory=list)
+    # History stats, kept as running aggregates
+    history_count: int = 0
+    history_total: int = 0
+    max_history_length: int = 0
+    min_history_length: int = 0
 
     @property
     def accuracy(self) -> float:
@@ -131,19 +146,24 @@ class EvalMetrics:
     @property
     def average_history_length(self) -> float:
         """Calculate average history length."""
-        if not self.history_lengths:
+        if not self.history_count:
             return 0.0
-        return sum(self.history_lengths) / len(self.history_lengths)
-
-    @property
-    def max_history_length(self) -> int:
-        """Get maximum history length."""
-        return max(self.history_lengths) if self.history_lengths else 0
-
-    @property
-    def min_history_length(self) -> int:
-        """Get minimum history length."""
-        return min(self.history_lengths) if self.history_lengths else 0
+        return self.history_total / self.history_count
+
+    def add_status(self, status: str) -> None:
+        """Count one task's status."""
+        counter = _STATUS_COUNTERS.get(status, "unknown")
+        setattr(self, counter, getattr(self, counter) + 1)
+
+    def add_history_length(self, length: int) -> None:
+        """Record one task's history length."""
+        if self.history_count:
+            self.max_history_length = max(self.max_history_length, length)
+            self.min_history_length = min(self.min_history_length, length)
+        else:
+            self.max_history_length = self.min_history_length = length
+        self.history_count += 1
+        self.history_total += length
 
     def add_result(self, result: TaskResult, is_correct: bool) -> None:
         """Add a task result to the metrics."""
@@ -154,24 +174,10 @@ class EvalMetrics:
             self.failed += 1
 
         # Track status
-        match result.status:
-            case TaskStatus.COMPLETED:
-                self.completed += 1
-            case TaskStatus.AGENT_CONTEXT_LIMIT:
-                self.context_limit += 1
-            case TaskStatus.AGENT_VALIDATION_FAILED:
-                self.validation_failed += 1
-            case TaskStatus.AGENT_INVALID_ACTION:
-                self.invalid_action += 1
-            case TaskStatus.TASK_LIMIT_REACHED:
-                self.task_limit_reached += 1
-            case TaskStatus.TASK_ERROR:
-                self.task_error += 1
-            case _:
-                self.unknown += 1
+        self.add_status(result.status)
 
         # Track history length
-        self.history_lengths.append(len(result.history))
+        self.add_history_length(len(result.history))
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to AgentBench-compatible output format."""
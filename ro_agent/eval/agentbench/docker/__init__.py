@@ -1,5 +1,5 @@
 """Docker container management for OS interaction tasks."""
 
-from .container import EvalContainer
+from .container import ContainerPool, EvalContainer
 
-__all__ = ["EvalContainer"]
+__all__ = ["ContainerPool", "EvalContainer"]
@@ -1,7 +1,12 @@
 """Docker container management for OS interaction evaluation."""
 
 import asyncio
+import itertools
+import os
+import shlex
+import shutil
 import uuid
+from collections.abc import Mapping
 from typing import Any
 
 
@@ -12,6 +17,104 @@ IMAGE_MAP = {
     "ubuntu": "local-os/ubuntu",
 }
 
+# Resolved once rather than searched for on PATH at every spawn
+DOCKER_BIN = shutil.which("docker") or "docker"
+
+# Image name -> image ID, so docker run doesn't resolve the name each time
+_IMAGE_IDS: dict[str, str] = {}
+
+# Container names are this prefix plus a counter. The random part keeps
+# apart runs that reuse a pid (e.g. pid 1 inside a container) while
+# containers left over from an earlier run still exist.
+_NAME_PREFIX = f"ro-eval-{os.getpid()}-{uuid.uuid4().hex[:4]}"
+_name_counter = itertools.count()
+
+# Prefix of the line marking the end of a command's output on the
+# persistent shell's stdout and stderr
+_END_MARKER = "__RO_EVAL_END_"
+
+_READ_CHUNK = 65536
+
+# Output kept per stream of a command. Tool output is cut to a short head
+# anyway, so the rest is drained and dropped rather than held in memory.
+MAX_OUTPUT_BYTES = 1 << 20
+
+# Seconds a background start script gets before the next command runs
+BACKGROUND_START_GRACE = 1.0
+
+
+def _append_capped(buf: bytearray, data: bytes | bytearray) -> None:
+    """Append to buf, keeping at most MAX_OUTPUT_BYTES."""
+    room = MAX_OUTPUT_BYTES - len(buf)
+    if room > 0:
+        buf += data[:room]
+
+
+async def _read_capped(reader: asyncio.StreamReader) -> bytes:
+    """Read a stream to EOF, keeping the first MAX_OUTPUT_BYTES."""
+    kept = bytearray()
+    while chunk := await reader.read(_READ_CHUNK):
+        _append_capped(kept, chunk)
+    return bytes(kept)
+
+
+async def _read_through_marker(
+    reader: asyncio.StreamReader, marker: bytes
+) -> tuple[bytes, bytes] | None:
+    """Read until a line starting at `marker` is complete.
+
+    Output before the marker is capped like _read_capped's.
+
+    Returns:
+        (output before the marker, rest of the marker line), or None if
+        the stream ended first
+    """
+    kept = bytearray()
+    # Unconsumed data; only a possible partial marker is carried over
+    pending = bytearray()
+    while True:
+        chunk = await reader.read(_READ_CHUNK)
+        if not chunk:
+            return None
+        pending += chunk
+        idx = pending.find(marker)
+        if idx == -1:
+            cut = len(pending) - len(marker) + 1
+            if cut > 0:
+                _append_capped(kept, pending[:cut])
+                del pending[:cut]
+            continue
+        end = pending.find(b"\n", idx + len(marker))
+        if end != -1:
+            _append_capped(kept, pending[:idx])
+            return bytes(kept), bytes(pending[idx + len(marker) : end])
+
+
+async def _resolve_image(image: str) -> str:
+    """Resolve an image name to its ID, caching the result.
+
+    Falls back to the name if the image isn't available locally, so
+    docker run can still pull it.
+    """
+    if image in _IMAGE_IDS:
+        return _IMAGE_IDS[image]
+    proc = await asyncio.create_subprocess_exec(
+        DOCKER_BIN,
+        "image",
+        "inspect",
+        "-f",
+        "{{.Id}}",
+        image,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, _ = await proc.communicate()
+    image_id = stdout.decode("utf-8").strip()
+    if proc.returncode != 0 or not image_id:
+        return image
+    _IMAGE_IDS[image] = image_id
+    return image_id
+
 
 class EvalContainer:
     """Manages a Docker container for OS interaction evaluation.
@@ -30,6 +133,12 @@ class EvalContainer:
         self._image = IMAGE_MAP.get(image, image)
         self._container_id: str | None = None
         self._name: str | None = None
+        # Long-lived `docker exec -i ... bash` that commands are piped to,
+        # so each command doesn't pay for a new docker exec
+        self._shell: asyncio.subprocess.Process | None = None
+        self._shell_lock = asyncio.Lock()
+        # Loop time before which commands wait for a background script
+        self._ready_at = 0.0
 
     @property
     def is_running(self) -> bool:
@@ -46,19 +155,18 @@ class EvalContainer:
         if self._container_id:
             return  # Already running
 
-        # Generate unique container name
-        self._name = f"ro-eval-{uuid.uuid4().hex[:8]}"
+        self._name = f"{_NAME_PREFIX}-{next(_name_counter)}"
 
         # Start container in detached mode with bash
         cmd = [
-            "docker",
+            DOCKER_BIN,
             "run",
             "-d",
             "--name",
             self._name,
             "-it",  # Interactive with TTY
             "--rm",  # Auto-remove when stopped
-            self._image,
+            await _resolve_image(self._image),
             "/bin/bash",
         ]
 
@@ -75,6 +183,32 @@ class EvalContainer:
             raise RuntimeError(f"Failed to start container: {error}")
 
         self._container_id = stdout.decode("utf-8").strip()
+        await self._open_shell()
+
+    async def _open_shell(self) -> asyncio.subprocess.Process:
+        """Return the persistent shell, starting it if needed."""
+        if self._shell is None or self._shell.returncode is not None:
+            self._shell = await asyncio.create_subprocess_exec(
+                DOCKER_BIN,
+                "exec",
+                "-i",
+                self._container_id,
+                "/bin/bash",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        return self._shell
+
+    async def _close_shell(self) -> None:
+        """Stop the persistent shell, if any."""
+        shell, self._shell = self._shell, None
+        if shell is None or shell.returncode is not None:
+            return
+        shell.kill()
+        # Drain rather than just wait: a flooded pipe has stopped being
+        # read, and the process isn't reaped until its pipes hit EOF
+        await shell.communicate()
 
     async def execute(
         self,
@@ -92,11 +226,112 @@ class EvalContainer:
         Returns:
             Tuple of (exit_code, stdout, stderr)
         """
+        exit_code, stdout, stderr = await self._execute_raw(
+            command, timeout, working_dir
+        )
+        return (
+            exit_code,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
+
+    async def _execute_raw(
+        self,
+        command: str,
+        timeout: int = 120,
+        working_dir: str | None = None,
+    ) -> tuple[int, bytes, bytes]:
+        """Execute a command, returning its output undecoded."""
         if not self._container_id:
             raise RuntimeError("Container not started")
 
+        delay = self._ready_at - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        # The shell runs one command at a time; overlapping calls fall back
+        # to their own docker exec
+        if self._shell_lock.locked():
+            return await self._execute_once(command, timeout, working_dir)
+        async with self._shell_lock:
+            return await self._execute_in_shell(command, timeout, working_dir)
+
+    async def _execute_in_shell(
+        self,
+        command: str,
+        timeout: int,
+        working_dir: str | None,
+    ) -> tuple[int, bytes, bytes]:
+        """Execute a command through the persistent shell.
+
+        Each command still runs in its own `bash -c` with stdin from
+        /dev/null, so it gets a fresh environment as with docker exec, and
+        syntax errors or `exit` can't break the shell. Its stdout and
+        stderr reach the shell's streams through `cat`s in a pipeline,
+        which finishes only once every writer, including background jobs
+        the command started, has closed them, as docker exec's streams do.
+        So late output can't spill into the next command, and a chatty
+        command is held back by the pipes rather than buffered anywhere.
+        The shell then prints an end marker, carrying the exit code on
+        stderr, to each stream.
+        """
+        shell = await self._open_shell()
+        marker = f"{_END_MARKER}{uuid.uuid4().hex}_"
+        inner = f"bash -c {shlex.quote(command)} < /dev/null"
+        if working_dir:
+            inner = f"(cd {shlex.quote(working_dir)} && {inner})"
+        # stdout goes out through fd 3 to the outer cat, stderr through the
+        # inner one; pipefail keeps the command's exit code
+        payload = (
+            f"set -o pipefail; {{ {inner} 2>&1 1>&3 3>&- | cat >&2; }} 3>&1 | cat\n"
+            f"__rc=$?; printf '{marker}%d\\n' \"$__rc\" >&2; printf '{marker}\\n'\n"
+        )
+
+        # Any write or read left unfinished (timeout, cancellation) leaves
+        # the shell mid-command, so it's thrown away and reopened next call
+        try:
+            shell.stdin.write(payload.encode("utf-8"))
+            await shell.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            await self._close_shell()
+            return await self._execute_once(command, timeout, working_dir)
+        except BaseException:
+            await self._close_shell()
+            raise
+
+        try:
+            out, err = await asyncio.wait_for(
+                asyncio.gather(
+                    _read_through_marker(shell.stdout, marker.encode()),
+                    _read_through_marker(shell.stderr, marker.encode()),
+                ),
+                timeout=timeout,
+            )
+        except TimeoutError:
+            await self._close_shell()
+            raise TimeoutError(f"Command timed out after {timeout} seconds")
+        except BaseException:
+            await self._close_shell()
+            raise
+
+        if out is None or err is None:
+            # The shell died; run the command on its own instead
+            await self._close_shell()
+            return await self._execute_once(command, timeout, working_dir)
+
+        stdout, _ = out
+        stderr, status = err
+        return int(status), stdout, stderr
+
+    async def _execute_once(
+        self,
+        command: str,
+        timeout: int,
+        working_dir: str | None,
+    ) -> tuple[int, bytes, bytes]:
+        """Execute a command in its own docker exec process."""
         # Build docker exec command
-        exec_cmd = ["docker", "exec"]
+        exec_cmd = [DOCKER_BIN, "exec"]
 
         if working_dir:
             exec_cmd.extend(["-w", working_dir])
@@ -110,21 +345,21 @@ class EvalContainer:
         )
 
         try:
-            stdout, stderr = await asyncio.wait_for(
-                proc.communicate(),
+            stdout, stderr, _ = await asyncio.wait_for(
+                asyncio.gather(
+                    _read_capped(proc.stdout),
+                    _read_capped(proc.stderr),
+                    proc.wait(),
+                ),
                 timeout=timeout,
             )
-        except asyncio.TimeoutError:
-            # Kill the exec process
+        except TimeoutError:
+            # Kill the exec process, draining its pipes as in _close_shell
             proc.kill()
-            await proc.wait()
+            await proc.communicate()
             raise TimeoutError(f"Command timed out after {timeout} seconds")
 
-        exit_code = proc.returncode or 0
-        stdout_str = stdout.decode("utf-8", errors="replace")
-        stderr_str = stderr.decode("utf-8", errors="replace")
-
-        return exit_code, stdout_str, stderr_str
+        return proc.returncode or 0, stdout, stderr
 
     async def run_init(self, code: str) -> None:
         """Run initialization code in the container.
@@ -135,31 +370,49 @@ class EvalContainer:
         if not code:
             return
 
-        exit_code, stdout, stderr = await self.execute(code, timeout=60)
+        # Output only matters on failure, so it's decoded only then
+        exit_code, _, stderr = await self._execute_raw(code, timeout=60)
         if exit_code != 0:
-            raise RuntimeError(f"Init script failed: {stderr}")
+            error = stderr.decode("utf-8", errors="replace")
+            raise RuntimeError(f"Init script failed: {error}")
 
     async def run_init_file(self, file_path: str) -> None:
         """Run an initialization script file in the container.
 
-        Reads the script content from host and runs it in the container
-        via docker exec (matching AgentBench's approach).
+        Copies the script into the container with docker cp and runs it
+        with bash, rather than passing its content as a `bash -c` argument.
 
         Args:
             file_path: Path to script file on host
         """
         if not file_path:
             return
-
-        # Read script content from host
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                script_content = f.read()
-        except FileNotFoundError:
+        if not self._container_id:
+            raise RuntimeError("Container not started")
+        if not os.path.isfile(file_path):
             raise RuntimeError(f"Init script file not found: {file_path}")
 
-        # Run script content in container via docker exec
-        await self.run_init(script_content)
+        script_path = f"/tmp/ro_init_{uuid.uuid4().hex}.sh"
+        proc = await asyncio.create_subprocess_exec(
+            DOCKER_BIN,
+            "cp",
+            file_path,
+            f"{self._container_id}:{script_path}",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            error = stderr.decode("utf-8", errors="replace")
+            raise RuntimeError(f"Failed to copy init script: {error}")
+
+        exit_code, _, stderr = await self._execute_raw(
+            f"bash {script_path}; rc=$?; rm -f {script_path}; exit $rc",
+            timeout=60,
+        )
+        if exit_code != 0:
+            error = stderr.decode("utf-8", errors="replace")
+            raise RuntimeError(f"Init script failed: {error}")
 
     async def run_background(self, script: str) -> None:
         """Run a script as a background process.
@@ -169,29 +422,41 @@ class EvalContainer:
         """
         if not script:
             return
+        if not self._container_id:
+            raise RuntimeError("Container not started")
 
-        # The script likely already has & at the end, but make sure
-        # We use nohup to prevent it from being killed when the exec session ends
-        bg_script = script
-        if not bg_script.strip().endswith("&"):
-            bg_script = bg_script + " &"
-
-        # Use nohup and redirect output to prevent blocking
-        exit_code, stdout, stderr = await self.execute(
-            f"nohup {bg_script} > /dev/null 2>&1",
-            timeout=10,
+        # docker exec -d detaches the process itself (no nohup or & needed)
+        # and discards its output, so it can't write into the persistent
+        # shell's output
+        proc = await asyncio.create_subprocess_exec(
+            DOCKER_BIN,
+            "exec",
+            "-d",
+            self._container_id,
+            "/bin/bash",
+            "-c",
+            script,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
+        await proc.communicate()
 
-        # Give the background process time to start
-        await asyncio.sleep(1)
+        # Give the background process time to start. Rather than sleeping
+        # here, the next execute() waits out what's left, so the grace
+        # period overlaps with the agent's first model call.
+        self._ready_at = asyncio.get_running_loop().time() + BACKGROUND_START_GRACE
 
     async def cleanup(self) -> None:
         """Stop and remove the container."""
         if not self._container_id:
             return
 
-        # Stop the container (--rm flag will auto-remove it)
-        stop_cmd = ["docker", "stop", self._container_id]
+        await self._close_shell()
+
+        # Kill rather than stop: the container is discarded, so there's no
+        # point in docker stop's 10 s SIGTERM grace period (--rm flag will
+        # auto-remove it)
+        stop_cmd = [DOCKER_BIN, "kill", self._container_id]
 
         proc = await asyncio.create_subprocess_exec(
             *stop_cmd,
@@ -211,3 +476,61 @@ class EvalContainer:
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
         await self.cleanup()
+
+
+class ContainerPool:
+    """Starts eval containers ahead of time so tasks don't wait on docker run.
+
+    Containers are never reused: tasks change files, users and processes
+    anywhere in the container, which no cheap reset can reliably undo.
+    Instead, each acquire() hands out a container started in the
+    background and starts a replacement for the next task.
+    """
+
+    def __init__(self, demand: Mapping[str, int] | None = None, size: int = 1) -> None:
+        """Initialize the pool.
+
+        Args:
+            demand: Number of containers that will be acquired per image, so
+                no spare is started that no task will use; unlimited if None
+            size: Number of spare containers to keep starting per image
+        """
+        self._size = size
+        self._remaining = dict(demand) if demand is not None else None
+        self._spares: dict[str, list[asyncio.Task[EvalContainer]]] = {}
+
+    def _spawn(self, image: str) -> "asyncio.Task[EvalContainer]":
+        """Start a container for `image` in the background."""
+
+        async def start() -> EvalContainer:
+            container = EvalContainer(image=image)
+            await container.start()
+            return container
+
+        return asyncio.create_task(start())
+
+    async def acquire(self, image: str = "default") -> EvalContainer:
+        """Get a freshly started container; the caller cleans it up.
+
+        Args:
+            image: Image identifier, as for EvalContainer
+        """
+        spares = self._spares.setdefault(image, [])
+        pending = spares.pop(0) if spares else self._spawn(image)
+        wanted = self._size
+        if self._remaining is not None:
+            left = self._remaining.get(image, 0) - 1
+            self._remaining[image] = left
+            wanted = min(wanted, left)
+        while len(spares) < wanted:
+            spares.append(self._spawn(image))
+        return await pending
+
+    async def close(self) -> None:
+        """Stop spare containers that were never handed out."""
+        pending = [task for tasks in self._spares.values() for task in tasks]
+        self._spares.clear()
+        started = await asyncio.gather(*pending, return_exceptions=True)
+        await asyncio.gather(
+            *(c.cleanup() for c in started if isinstance(c, EvalContainer))
+        )
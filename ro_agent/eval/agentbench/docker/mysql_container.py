@@ -3,6 +3,14 @@
 import asyncio
 import uuid
 
+from .container import DOCKER_BIN
+
+# Seconds between readiness probes while MySQL starts
+HEALTH_POLL_INTERVAL = 0.2
+
+# MySQL client/server protocol version sent first in the server greeting
+_PROTOCOL_VERSION = 10
+
 
 class MySQLContainer:
     """Manages a MySQL 8 Docker container for DBBench evaluation.
@@ -40,7 +48,7 @@ class MySQLContainer:
 
         # Start MySQL with performance-tuned settings
         cmd = [
-            "docker",
+            DOCKER_BIN,
             "run",
             "-d",
             "--name",
@@ -78,7 +86,7 @@ class MySQLContainer:
     async def _get_container_ip(self) -> str:
         """Get the container's IP address."""
         cmd = [
-            "docker",
+            DOCKER_BIN,
             "inspect",
             "-f",
             "{{.NetworkSettings.IPAddress}}",
@@ -94,35 +102,38 @@ class MySQLContainer:
         stdout, _ = await proc.communicate()
         return stdout.decode("utf-8").strip()
 
+    async def _probe(self) -> bool:
+        """Check whether MySQL sends its greeting on the container's port.
+
+        The image's entrypoint runs its init server with networking off,
+        so a greeting on TCP means the final server is up.
+        """
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self._host, self.PORT), timeout=1.0
+            )
+        except (OSError, TimeoutError):
+            return False
+        try:
+            header = await asyncio.wait_for(reader.readexactly(4), timeout=1.0)
+            length = int.from_bytes(header[:3], "little")
+            payload = await asyncio.wait_for(reader.readexactly(length), timeout=1.0)
+        except (OSError, TimeoutError, asyncio.IncompleteReadError):
+            return False
+        finally:
+            writer.close()
+        # An error packet (0xff) instead means the server is refusing clients
+        return bool(payload) and payload[0] == _PROTOCOL_VERSION
+
     async def _wait_healthy(self, timeout: int = 60) -> None:
         """Wait for MySQL to accept connections and be fully initialized."""
-        start = asyncio.get_event_loop().time()
-
-        while asyncio.get_event_loop().time() - start < timeout:
-            # Test that we can actually execute a query with auth
-            cmd = [
-                "docker",
-                "exec",
-                self._container_id,
-                "mysql",
-                "-u",
-                "root",
-                f"-p{self.PASSWORD}",
-                "-e",
-                "SELECT 1",
-            ]
-
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, stderr = await proc.communicate()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
 
-            if proc.returncode == 0:
+        while loop.time() - start < timeout:
+            if await self._probe():
                 return
-
-            await asyncio.sleep(1)
+            await asyncio.sleep(HEALTH_POLL_INTERVAL)
 
         raise TimeoutError(f"MySQL not ready after {timeout} seconds")
 
@@ -148,7 +159,7 @@ class MySQLContainer:
             raise RuntimeError("Container not started")
 
         cmd = [
-            "docker",
+            DOCKER_BIN,
             "exec",
             self._container_id,
             "mysql",
@@ -177,7 +188,7 @@ class MySQLContainer:
             return
 
         cmd = [
-            "docker",
+            DOCKER_BIN,
             "exec",
             self._container_id,
             "mysql",
@@ -200,7 +211,7 @@ class MySQLContainer:
         if not self._container_id:
             return
 
-        cmd = ["docker", "rm", "-f", self._container_id]
+        cmd = [DOCKER_BIN, "rm", "-f", self._container_id]
 
         proc = await asyncio.create_subprocess_exec(
             *cmd,
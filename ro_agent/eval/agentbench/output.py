@@ -249,24 +249,10 @@ def rebuild_metrics_from_runs(output_dir: Path | str) -> EvalMetrics:
             metrics.failed += 1
 
         # Count status
-        status = r.get("status", "unknown")
-        if status == "completed":
-            metrics.completed += 1
-        elif status == "agent context limit":
-            metrics.context_limit += 1
-        elif status == "agent validation failed":
-            metrics.validation_failed += 1
-        elif status == "agent invalid action":
-            metrics.invalid_action += 1
-        elif status == "task limit reached":
-            metrics.task_limit_reached += 1
-        elif status == "task error":
-            metrics.task_error += 1
-        else:
-            metrics.unknown += 1
+        metrics.add_status(r.get("status", "unknown"))
 
         # Track history length
         history = r.get("history", [])
-        metrics.history_lengths.append(len(history))
+        metrics.add_history_length(len(history))
 
     return metrics
@@ -56,6 +56,7 @@ Always use a tool provided instead of simply responding with content.
 import asyncio
 import sys
 import uuid
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
@@ -81,7 +82,7 @@ from .config import (
     TaskResult,
     TaskStatus,
 )
-from .docker.container import EvalContainer
+from .docker.container import ContainerPool, EvalContainer
 from .docker.mysql_container import MySQLContainer
 from .evaluators.db_evaluator import DBBenchEvaluator
 from .evaluators.os_evaluator import OSEvaluator
@@ -119,6 +120,7 @@ class EvalRunner:
         self._db_evaluator = DBBenchEvaluator()
         self._os_evaluator = OSEvaluator(scripts_dir=scripts_dir)
         self._mysql_container: MySQLContainer | None = None
+        self._container_pool: ContainerPool | None = None
 
         # Log client type once at init
         if self._is_cerebras():
@@ -163,6 +165,9 @@ class EvalRunner:
         if self._mysql_container:
             await self._mysql_container.cleanup()
             self._mysql_container = None
+        if self._container_pool:
+            await self._container_pool.close()
+            self._container_pool = None
 
     async def run_dbbench_task(self, task: DBBenchTask) -> TaskResult:
         """Run a single DBBench task.
@@ -183,6 +188,7 @@ class EvalRunner:
         """Run a DBBench task using SQLite (for SELECT queries)."""
         db_path = None
         handler = None
+        client = None
 
         try:
             # Create temporary SQLite database
@@ -325,10 +331,13 @@ class EvalRunner:
                 handler.close()
             if db_path and Path(db_path).exists():
                 Path(db_path).unlink()
+            if client:
+                await client.aclose()
 
     async def _run_dbbench_task_mysql(self, task: DBBenchTask) -> TaskResult:
         """Run a DBBench mutation task using MySQL for hash-based evaluation."""
         handler = None
+        client = None
         db_name = f"eval_{task.index}_{uuid.uuid4().hex[:6]}"
 
         try:
@@ -469,6 +478,8 @@ class EvalRunner:
                 handler.close()
             if self._mysql_container:
                 await self._mysql_container.drop_database(db_name)
+            if client:
+                await client.aclose()
 
     async def _init_mysql_table(self, handler: UnrestrictedMySQLHandler, task: DBBenchTask) -> None:
         """Initialize MySQL table with task data."""
@@ -532,11 +543,15 @@ class EvalRunner:
             TaskResult with evaluation results
         """
         container = None
+        client = None
 
         try:
-            # Start Docker container
-            container = EvalContainer(image=task.image)
-            await container.start()
+            # Start Docker container (pre-started by the pool when batching)
+            if self._container_pool is not None:
+                container = await self._container_pool.acquire(task.image)
+            else:
+                container = EvalContainer(image=task.image)
+                await container.start()
 
             # Run init code/file
             if task.init_code:
@@ -681,6 +696,8 @@ class EvalRunner:
             # Cleanup container
             if container:
                 await container.cleanup()
+            if client:
+                await client.aclose()
 
     def _get_system_prompt(self, task_type: str) -> str:
         """Get the system prompt for a task type.
@@ -711,6 +728,10 @@ class EvalRunner:
     ) -> tuple[list[TaskResult], EvalMetrics]:
         """Run multiple DBBench tasks with optional parallelism.
 
+        With config.parallel above 1, up to that many tasks run at once,
+        so one task's model calls overlap with another's database setup
+        and queries; otherwise tasks run one after another.
+
         Args:
             tasks: List of tasks to run
             output_dir: Directory for incremental result saving
@@ -817,6 +838,10 @@ class EvalRunner:
     ) -> tuple[list[TaskResult], EvalMetrics]:
         """Run multiple OS tasks with optional parallelism.
 
+        Up to config.parallel tasks run at once (one at a time when it is
+        1), each in a fresh container that the pool starts ahead of the
+        task that will use it.
+
         Args:
             tasks: List of tasks to run
             output_dir: Directory for incremental result saving
@@ -856,50 +881,61 @@ class EvalRunner:
             else:
                 consecutive_errors = 0
 
-        if self.config.parallel > 1:
-            pending = [run_with_semaphore(task) for task in tasks]
-            for coro in asyncio.as_completed(pending):
-                result = await coro
-                results.append(result)
+        # Keep one container per image starting ahead of the tasks that
+        # will need it, and none beyond the tasks left
+        self._container_pool = ContainerPool(
+            demand=Counter(task.image for task in tasks)
+        )
 
-                # Save incrementally
-                append_result(result, output_dir)
+        try:
+            if self.config.parallel > 1:
+                pending = [run_with_semaphore(task) for task in tasks]
+                for coro in asyncio.as_completed(pending):
+                    result = await coro
+                    results.append(result)
 
-                is_correct = (
-                    result.result.result
-                    if isinstance(result.result, OSResult)
-                    else False
-                )
-                metrics.add_result(result, is_correct)
-                update_overall(metrics, output_dir)
+                    # Save incrementally
+                    append_result(result, output_dir)
 
-                # Check for consecutive errors (less reliable in parallel mode)
-                check_consecutive_errors(result)
+                    is_correct = (
+                        result.result.result
+                        if isinstance(result.result, OSResult)
+                        else False
+                    )
+                    metrics.add_result(result, is_correct)
+                    update_overall(metrics, output_dir)
 
-                if progress_callback:
-                    progress_callback(len(results), len(tasks))
-        else:
-            for task in tasks:
-                result = await self.run_os_task(task)
-                results.append(result)
+                    # Check for consecutive errors (less reliable in parallel mode)
+                    check_consecutive_errors(result)
 
-                # Save incrementally
-                append_result(result, output_dir)
+                    if progress_callback:
+                        progress_callback(len(results), len(tasks))
+            else:
+                for task in tasks:
+                    result = await self.run_os_task(task)
+                    results.append(result)
 
-                is_correct = (
-                    result.result.result
-                    if isinstance(result.result, OSResult)
-                    else False
-                )
-                metrics.add_result(result, is_correct)
-                update_overall(metrics, output_dir)
+                    # Save incrementally
+                    append_result(result, output_dir)
 
-                # Check for consecutive errors
-                check_consecutive_errors(result)
+                    is_correct = (
+                        result.result.result
+                        if isinstance(result.result, OSResult)
+                        else False
+                    )
+                    metrics.add_result(result, is_correct)
+                    update_overall(metrics, output_dir)
+
+                    # Check for consecutive errors
+                    check_consecutive_errors(result)
+
+                    if progress_callback:
+                        progress_callback(len(results), len(tasks))
 
-                if progress_callback:
-                    progress_callback(len(results), len(tasks))
+            results.sort(key=lambda r: r.index)
 
-        results.sort(key=lambda r: r.index)
+        finally:
+            # Stop spare containers that were never used
+            await self.cleanup()
 
         return results, metrics
@@ -11,7 +11,6 @@ load_dotenv()
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
 from .config import EvalAbortedError, EvalConfig
 from .output import (
@@ -21,8 +20,6 @@ from .output import (
     rebuild_metrics_from_runs,
     save_run_config,
 )
-from .runner import BirdRunner
-from .task import load_bird_tasks
 
 console = Console()
 
@@ -99,6 +96,12 @@ def bird(
         ro-eval bird mini_dev_sqlite.json dev_databases/ --difficulty challenging
         ro-eval bird mini_dev_sqlite.json dev_databases/ --no-evidence
     """
+    # Deferred so --help doesn't load the agent and model client
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+
+    from .runner import BirdRunner
+    from .task import load_bird_tasks
+
     # Validate difficulty
     if difficulty and difficulty not in ("simple", "moderate", "challenging"):
         console.print(f"[red]Invalid difficulty: {difficulty}[/red]")
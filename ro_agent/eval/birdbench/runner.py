@@ -64,6 +64,7 @@ class BirdRunner:
         """
         tmp_db_path = None
         handler = None
+        client = None
 
         try:
             # Copy database to temp file (agent safety)
@@ -185,6 +186,8 @@ class BirdRunner:
                 handler.close()
             if tmp_db_path and Path(tmp_db_path).exists():
                 Path(tmp_db_path).unlink()
+            if client:
+                await client.aclose()
 
     async def run_tasks(
         self,
@@ -152,6 +152,7 @@ async def run_task(instruction: str, working_dir: str = "/app") -> None:
     finally:
         if processor:
             await processor.end_session()
+        await agent.aclose()
 
     print()  # Final newline
 
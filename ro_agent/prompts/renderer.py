@@ -23,6 +23,9 @@ def _create_jinja_env() -> Environment:
 # Shared environment instance
 _jinja_env = _create_jinja_env()
 
+# Delimiters that start Jinja2 expressions, statements, and comments
+_JINJA_MARKERS = ("{{", "{%", "{#")
+
 
 def render_string(template_str: str, variables: dict[str, Any]) -> str:
     """Render a Jinja2 template string with variables.
@@ -43,6 +46,13 @@ def render_string(template_str: str, variables: dict[str, Any]) -> str:
     Raises:
         ValueError: If template syntax is invalid or required variable is missing
     """
+    # Plain text has nothing to substitute; skip compiling it as a template,
+    # but normalize newlines the way Jinja's lexer would
+    if not any(marker in template_str for marker in _JINJA_MARKERS):
+        if "\r" in template_str:
+            return template_str.replace("\r\n", "\n").replace("\r", "\n")
+        return template_str
+
     try:
         template = _jinja_env.from_string(template_str)
         return template.render(**variables)
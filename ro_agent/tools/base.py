@@ -57,6 +57,14 @@ class ToolHandler(ABC):
         """
         return False
 
+    @property
+    def parallel_safe(self) -> bool:
+        """Whether this tool can run concurrently with other parallel-safe calls.
+
+        Override to return True for tools with no side effects.
+        """
+        return False
+
     @abstractmethod
     async def handle(self, invocation: ToolInvocation) -> ToolOutput:
         """Execute the tool and return the result."""
@@ -25,6 +25,10 @@ class GlobHandler(ToolHandler):
     def name(self) -> str:
         return "glob"
 
+    @property
+    def parallel_safe(self) -> bool:
+        return True
+
     @property
     def description(self) -> str:
         return "Find files by name or path pattern. Returns a list of matching file paths."
@@ -30,6 +30,10 @@ class GrepHandler(ToolHandler):
     def name(self) -> str:
         return "grep"
 
+    @property
+    def parallel_safe(self) -> bool:
+        return True
+
     @property
     def description(self) -> str:
         return (
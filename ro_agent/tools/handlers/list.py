@@ -22,6 +22,10 @@ class ListHandler(ToolHandler):
     def name(self) -> str:
         return "list"
 
+    @property
+    def parallel_safe(self) -> bool:
+        return True
+
     @property
     def description(self) -> str:
         return "List the contents of a single directory. Shows file names, sizes, and modification times."
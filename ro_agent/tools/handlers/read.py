@@ -39,6 +39,10 @@ class ReadHandler(ToolHandler):
     def name(self) -> str:
         return "read"
 
+    @property
+    def parallel_safe(self) -> bool:
+        return True
+
     @property
     def description(self) -> str:
         return (
@@ -58,6 +58,10 @@ class ReadExcelHandler(ToolHandler):
     def name(self) -> str:
         return "read_excel"
 
+    @property
+    def parallel_safe(self) -> bool:
+        return True
+
     @property
     def description(self) -> str:
         return (
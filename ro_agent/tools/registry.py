@@ -43,24 +43,37 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._handlers: dict[str, ToolHandler] = {}
+        self._specs: list[dict[str, Any]] | None = None
 
     def register(self, handler: ToolHandler) -> None:
         """Register a tool handler."""
         self._handlers[handler.name] = handler
+        self._specs = None
 
     def get(self, name: str) -> ToolHandler | None:
         """Get a handler by name."""
         return self._handlers.get(name)
 
     def get_specs(self) -> list[dict[str, Any]]:
-        """Get all tool specs for the LLM."""
-        return [handler.to_spec() for handler in self._handlers.values()]
+        """Get all tool specs for the LLM.
+
+        Specs are built once and shared until another handler is registered;
+        callers must not modify the returned list.
+        """
+        if self._specs is None:
+            self._specs = [handler.to_spec() for handler in self._handlers.values()]
+        return self._specs
 
     def requires_approval(self, tool_name: str) -> bool:
         """Check if a tool requires user approval before execution."""
         handler = self._handlers.get(tool_name)
         return handler.requires_approval if handler else True
 
+    def parallel_safe(self, tool_name: str) -> bool:
+        """Check if a tool can run concurrently with other parallel-safe calls."""
+        handler = self._handlers.get(tool_name)
+        return handler.parallel_safe if handler else False
+
     async def dispatch(self, invocation: ToolInvocation) -> ToolOutput:
         """Dispatch a tool invocation to the appropriate handler."""
         handler = self._handlers.get(invocation.tool_name)
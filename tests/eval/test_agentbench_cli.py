@@ -0,0 +1,63 @@
+"""Tests for the AgentBench CLI's task selection."""
+
+from collections.abc import Callable
+from typing import NamedTuple
+
+import pytest
+
+from ro_agent.eval.agentbench.cli import _select_tasks
+
+
+class Task(NamedTuple):
+    """Minimal task with an index and a type."""
+
+    index: int
+    kind: str
+
+
+TASKS = [Task(i, "select" if i % 2 else "update") for i in range(10)]
+
+
+def _is_update(task: Task) -> bool:
+    """Keep only update tasks (even indices)."""
+    return task.kind == "update"
+
+
+class TestSelectTasks:
+    """Tests for _select_tasks."""
+
+    @pytest.mark.parametrize(
+        ("offset", "limit", "completed", "keep", "expected"),
+        [
+            (0, None, set(), None, list(range(10))),
+            (3, None, set(), None, [3, 4, 5, 6, 7, 8, 9]),
+            (0, 3, set(), None, [0, 1, 2]),
+            (8, 5, set(), None, [8, 9]),
+            (-2, 2, set(), None, [0, 1]),
+            (0, 0, set(), None, []),
+            (0, -1, set(), None, []),
+            (20, None, set(), None, []),
+            # Completed tasks are dropped from the window, not replaced
+            (2, 4, {2, 4}, None, [3, 5]),
+            # The window applies after filtering
+            (0, None, set(), _is_update, [0, 2, 4, 6, 8]),
+            (1, 2, set(), _is_update, [2, 4]),
+            (1, 3, {4}, _is_update, [2, 6]),
+        ],
+    )
+    def test_selection(
+        self,
+        offset: int,
+        limit: int | None,
+        completed: set[int],
+        keep: Callable[[Task], bool] | None,
+        expected: list[int],
+    ) -> None:
+        """Test filtering, the offset/limit window and skipping completed tasks."""
+        selected = _select_tasks(TASKS, offset, limit, completed, keep)
+        assert [t.index for t in selected] == expected
+
+    def test_accepts_iterator(self) -> None:
+        """Test that tasks can be a one-shot iterator."""
+        selected = _select_tasks(iter(TASKS), 1, 2, set())
+        assert [t.index for t in selected] == [1, 2]
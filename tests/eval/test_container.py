@@ -0,0 +1,151 @@
+"""Tests for the OS eval container helpers."""
+
+import asyncio
+
+import pytest
+
+from ro_agent.eval.agentbench.docker import container
+from ro_agent.eval.agentbench.docker.container import _read_through_marker
+
+MARKER = b"__RO_EVAL_END_abc_"
+
+
+def _reader(*chunks: bytes, eof: bool = False) -> asyncio.StreamReader:
+    """Create a StreamReader pre-fed with chunks."""
+    reader = asyncio.StreamReader()
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    if eof:
+        reader.feed_eof()
+    return reader
+
+
+class TestReadThroughMarker:
+    """Tests for _read_through_marker."""
+
+    @pytest.mark.asyncio
+    async def test_output_and_status(self) -> None:
+        """Test that output before the marker and the marker line's rest are split."""
+        reader = _reader(b"hello\nworld\n" + MARKER + b"3\n")
+        assert await _read_through_marker(reader, MARKER) == (b"hello\nworld\n", b"3")
+
+    @pytest.mark.asyncio
+    async def test_empty_output(self) -> None:
+        """Test a command that printed nothing."""
+        reader = _reader(MARKER + b"\n")
+        assert await _read_through_marker(reader, MARKER) == (b"", b"")
+
+    @pytest.mark.asyncio
+    async def test_marker_split_across_chunks(self) -> None:
+        """Test that a marker arriving in pieces is still found."""
+        reader = _reader(b"out" + MARKER[:5], MARKER[5:12], MARKER[12:] + b"0", b"\n")
+        assert await _read_through_marker(reader, MARKER) == (b"out", b"0")
+
+    @pytest.mark.asyncio
+    async def test_marker_line_completed_later(self) -> None:
+        """Test that the read waits for the newline ending the marker line."""
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"x" + MARKER + b"12")
+        task = asyncio.ensure_future(_read_through_marker(reader, MARKER))
+        await asyncio.sleep(0)
+        assert not task.done()
+        reader.feed_data(b"7\n")
+        assert await task == (b"x", b"127")
+
+    @pytest.mark.asyncio
+    async def test_eof_before_marker(self) -> None:
+        """Test that a stream ending without the marker returns None."""
+        reader = _reader(b"partial output", eof=True)
+        assert await _read_through_marker(reader, MARKER) is None
+
+    @pytest.mark.asyncio
+    async def test_output_is_capped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that output beyond MAX_OUTPUT_BYTES is drained and dropped."""
+        monkeypatch.setattr(container, "MAX_OUTPUT_BYTES", 10)
+        reader = _reader(b"a" * 25, b"b" * 25, MARKER + b"0\n")
+        assert await _read_through_marker(reader, MARKER) == (b"a" * 10, b"0")
+
+
+class StubContainer:
+    """Stand-in for EvalContainer that records starts and cleanups."""
+
+    instances: list["StubContainer"] = []
+
+    def __init__(self, image: str = "default") -> None:
+        self.image = image
+        self.started = False
+        self.cleaned_up = False
+        StubContainer.instances.append(self)
+
+    async def start(self) -> None:
+        self.started = True
+
+    async def cleanup(self) -> None:
+        self.cleaned_up = True
+
+
+class TestContainerPool:
+    """Tests for ContainerPool."""
+
+    @pytest.fixture(autouse=True)
+    def stub(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Make the pool start stub containers."""
+        StubContainer.instances = []
+        monkeypatch.setattr(container, "EvalContainer", StubContainer)
+
+    @staticmethod
+    async def _started(image: str) -> int:
+        """Count containers created for image, once spares have had a turn to start."""
+        await asyncio.sleep(0)
+        return sum(c.image == image for c in StubContainer.instances)
+
+    @pytest.mark.asyncio
+    async def test_prewarms_up_to_demand(self) -> None:
+        """Test that spares are started only for tasks still to come."""
+        pool = container.ContainerPool(demand={"os": 3}, size=1)
+        first = await pool.acquire("os")
+        assert first.started
+        assert await self._started("os") == 2  # The acquired one and one spare
+
+        await pool.acquire("os")
+        assert await self._started("os") == 3
+        await pool.acquire("os")
+        assert await self._started("os") == 3  # No spare after the last task
+
+        await pool.close()
+        assert not any(c.cleaned_up for c in StubContainer.instances)
+
+    @pytest.mark.asyncio
+    async def test_spares_never_exceed_remaining(self) -> None:
+        """Test that a larger pool size is capped by each image's demand."""
+        pool = container.ContainerPool(demand={"a": 2, "b": 1}, size=4)
+        await pool.acquire("a")
+        assert await self._started("a") == 2
+        await pool.acquire("b")
+        assert await self._started("b") == 1
+        await pool.acquire("a")
+        assert await self._started("a") == 2
+
+        await pool.close()
+        assert len(StubContainer.instances) == 3
+        assert not any(c.cleaned_up for c in StubContainer.instances)
+
+    @pytest.mark.asyncio
+    async def test_unexpected_image_gets_no_spare(self) -> None:
+        """Test that an image outside the demand is started on request only."""
+        pool = container.ContainerPool(demand={"a": 1})
+        await pool.acquire("other")
+        assert await self._started("other") == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_close_cleans_up_unused_spares(self) -> None:
+        """Test that without a demand, leftover spares are stopped on close."""
+        pool = container.ContainerPool(size=2)
+        acquired = await pool.acquire("os")
+        assert await self._started("os") == 3
+
+        await pool.close()
+        spares = [c for c in StubContainer.instances if c is not acquired]
+        assert all(c.cleaned_up for c in spares)
+        assert not acquired.cleaned_up
@@ -0,0 +1,275 @@
+"""Tests for the agent loop's tool execution and cancellation."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from ro_agent.client.model import Prompt, StreamEvent, ToolCall
+from ro_agent.core.agent import CANCEL_POLL_INTERVAL, Agent, AgentEvent
+from ro_agent.core.session import Session
+from ro_agent.tools.base import ToolHandler, ToolInvocation, ToolOutput
+from ro_agent.tools.registry import ToolRegistry
+
+
+class FakeClient:
+    """Model client that requests the given tool calls, then answers."""
+
+    def __init__(self, *calls: tuple[str, str, dict[str, Any]]) -> None:
+        self._calls = list(calls)
+
+    async def stream(self, prompt: Prompt) -> AsyncIterator[StreamEvent]:
+        """Stream the tool calls on the first request and text afterwards."""
+        calls, self._calls = self._calls, []
+        for call_id, name, args in calls:
+            yield StreamEvent(type="tool_call", tool_call=ToolCall(call_id, name, args))
+        if not calls:
+            yield StreamEvent(type="text", content="done")
+        yield StreamEvent(type="done", usage={"input_tokens": 1, "output_tokens": 1})
+
+    async def aclose(self) -> None:
+        """Nothing to release."""
+
+
+class EndlessClient:
+    """Model client that streams text until the turn is cancelled."""
+
+    async def stream(self, prompt: Prompt) -> AsyncIterator[StreamEvent]:
+        """Stream a text chunk every few milliseconds, forever."""
+        while True:
+            await asyncio.sleep(0.005)
+            yield StreamEvent(type="text", content=".")
+
+    async def aclose(self) -> None:
+        """Nothing to release."""
+
+
+class LoggingTool(ToolHandler):
+    """Tool that records when each call starts and ends.
+
+    A call yields to the event loop `yields` times (default 1) between
+    starting and ending, so concurrent calls interleave deterministically.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        log: list[tuple[str, str]],
+        parallel_safe: bool = True,
+        requires_approval: bool = False,
+    ) -> None:
+        self._name = name
+        self._log = log
+        self._parallel_safe = parallel_safe
+        self._requires_approval = requires_approval
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return "Log the call"
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return {"type": "object", "properties": {"yields": {"type": "integer"}}}
+
+    @property
+    def parallel_safe(self) -> bool:
+        return self._parallel_safe
+
+    @property
+    def requires_approval(self) -> bool:
+        return self._requires_approval
+
+    async def handle(self, invocation: ToolInvocation) -> ToolOutput:
+        self._log.append(("start", invocation.call_id))
+        for _ in range(invocation.arguments.get("yields", 1)):
+            await asyncio.sleep(0)
+        self._log.append(("end", invocation.call_id))
+        return ToolOutput(content=f"result {invocation.call_id}")
+
+
+def _agent(
+    tools: list[ToolHandler],
+    *calls: tuple[str, str, dict[str, Any]],
+    **kwargs: Any,
+) -> Agent:
+    """Create an agent over the given tools whose model requests calls."""
+    registry = ToolRegistry()
+    for tool in tools:
+        registry.register(tool)
+    return Agent(Session(system_prompt="test"), registry, FakeClient(*calls), **kwargs)
+
+
+async def _run(agent: Agent) -> list[AgentEvent]:
+    """Run one turn and collect its events."""
+    return [event async for event in agent.run_turn("go")]
+
+
+class TestParallelToolCalls:
+    """Tests for batching parallel-safe tool calls."""
+
+    @pytest.mark.asyncio
+    async def test_read_only_calls_run_concurrently(self) -> None:
+        """Test that consecutive parallel-safe calls start before any ends."""
+        log: list[tuple[str, str]] = []
+        agent = _agent(
+            [LoggingTool("read", log)],
+            ("a", "read", {}),
+            ("b", "read", {}),
+            ("c", "read", {}),
+        )
+        await _run(agent)
+        assert [step for step, _ in log[:3]] == ["start"] * 3
+        assert [step for step, _ in log[3:]] == ["end"] * 3
+
+    @pytest.mark.asyncio
+    async def test_results_keep_call_order(self) -> None:
+        """Test that results are recorded in tool_call order, not finish order."""
+        log: list[tuple[str, str]] = []
+        agent = _agent(
+            [LoggingTool("read", log)],
+            ("slow", "read", {"yields": 5}),
+            ("fast", "read", {"yields": 1}),
+        )
+        events = await _run(agent)
+        assert log.index(("end", "fast")) < log.index(("end", "slow"))
+
+        tool_messages = [m for m in agent._session.history if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == ["slow", "fast"]
+        assert [m["content"] for m in tool_messages] == ["result slow", "result fast"]
+        ends = [e.tool_result for e in events if e.type == "tool_end"]
+        assert ends == ["result slow", "result fast"]
+
+    @pytest.mark.asyncio
+    async def test_unsafe_call_breaks_batch(self) -> None:
+        """Test that a call that is not parallel-safe runs alone, in order."""
+        log: list[tuple[str, str]] = []
+        agent = _agent(
+            [LoggingTool("read", log), LoggingTool("write", log, parallel_safe=False)],
+            ("a", "read", {}),
+            ("b", "read", {}),
+            ("w", "write", {}),
+            ("c", "read", {}),
+        )
+        await _run(agent)
+        assert log == [
+            ("start", "a"),
+            ("start", "b"),
+            ("end", "a"),
+            ("end", "b"),
+            ("start", "w"),
+            ("end", "w"),
+            ("start", "c"),
+            ("end", "c"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_call_needing_approval_breaks_batch(self) -> None:
+        """Test that a parallel-safe call needing approval is not batched."""
+        log: list[tuple[str, str]] = []
+        approvals: list[str] = []
+
+        async def approve(name: str, args: dict[str, Any]) -> bool:
+            approvals.append(name)
+            return True
+
+        agent = _agent(
+            [LoggingTool("read", log), LoggingTool("gated", log, requires_approval=True)],
+            ("a", "read", {}),
+            ("g", "gated", {}),
+            ("b", "read", {}),
+            ("c", "read", {}),
+            approval_callback=approve,
+        )
+        await _run(agent)
+        assert approvals == ["gated"]
+        assert log == [
+            ("start", "a"),
+            ("end", "a"),
+            ("start", "g"),
+            ("end", "g"),
+            ("start", "b"),
+            ("start", "c"),
+            ("end", "b"),
+            ("end", "c"),
+        ]
+
+
+class TestCancelCheck:
+    """Tests for polling the external cancel_check during a turn."""
+
+    @staticmethod
+    async def _run_until_cancelled(agent: Agent) -> AgentEvent:
+        """Run a turn and return its final event, failing after a few seconds."""
+        events = await asyncio.wait_for(_run(agent), timeout=5)
+        return events[-1]
+
+    @pytest.mark.asyncio
+    async def test_flip_stops_turn(self) -> None:
+        """Test that cancel_check turning True ends the turn within a poll interval."""
+        flipped_at: float | None = None
+
+        def cancel_check() -> bool:
+            return flipped_at is not None
+
+        def flip() -> None:
+            nonlocal flipped_at
+            flipped_at = time.monotonic()
+
+        agent = Agent(
+            Session(system_prompt="test"),
+            ToolRegistry(),
+            EndlessClient(),  # type: ignore[arg-type]
+            cancel_check=cancel_check,
+        )
+        asyncio.get_running_loop().call_later(0.05, flip)
+        last = await self._run_until_cancelled(agent)
+        assert last.type == "cancelled"
+        assert flipped_at is not None
+        # One poll interval, plus slack for the next streamed chunk
+        assert time.monotonic() - flipped_at < CANCEL_POLL_INTERVAL + 0.05
+
+    @pytest.mark.asyncio
+    async def test_already_cancelled(self) -> None:
+        """Test that a cancel_check that is True at the start skips the model call."""
+        agent = Agent(
+            Session(system_prompt="test"),
+            ToolRegistry(),
+            EndlessClient(),  # type: ignore[arg-type]
+            cancel_check=lambda: True,
+        )
+        last = await self._run_until_cancelled(agent)
+        assert last.content == "Cancelled before model call"
+
+    @pytest.mark.asyncio
+    async def test_raising_check_keeps_polling(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a cancel_check that raises is logged and polled again."""
+        calls = 0
+
+        def cancel_check() -> bool:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return False  # The check before the turn starts
+            if calls <= 3:
+                raise OSError("signal file unreadable")
+            return True
+
+        agent = Agent(
+            Session(system_prompt="test"),
+            ToolRegistry(),
+            EndlessClient(),  # type: ignore[arg-type]
+            cancel_check=cancel_check,
+        )
+        last = await self._run_until_cancelled(agent)
+        assert last.type == "cancelled"
+        assert calls == 4
+        errors = [r for r in caplog.records if "cancel_check raised" in r.getMessage()]
+        assert len(errors) == 1
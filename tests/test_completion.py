@@ -0,0 +1,122 @@
+"""Tests for inline file path completion."""
+
+import os
+from pathlib import Path
+
+import pytest
+from prompt_toolkit.document import Document
+
+from ro_agent import completion
+from ro_agent.completion import InlinePathCompleter, _list_dir, _trailing_path
+
+
+class TestTrailingPath:
+    """Tests for _trailing_path."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("", None),
+            ("word", None),
+            ("look at word", None),
+            ("file.txt", None),
+            ("~", "~"),
+            ("~/pro", "~/pro"),
+            ("open ~/.bashrc", "~/.bashrc"),
+            ("./", "./"),
+            ("read ./src/ma", "./src/ma"),
+            ("../x/", "../x/"),
+            ("cat /var/log/sys", "/var/log/sys"),
+            ("compare a,b/c", "b/c"),
+            ("path 'src/", "src/"),
+        ],
+    )
+    def test_tokens(self, text: str, expected: str | None) -> None:
+        """Test which trailing tokens are treated as paths."""
+        assert _trailing_path(text) == expected
+
+
+class TestInlinePathCompleter:
+    """Tests for InlinePathCompleter.get_completions."""
+
+    @pytest.fixture
+    def root(self, tmp_path: Path) -> Path:
+        """Create a directory with files, a subdirectory and a hidden file."""
+        for name in ("alpha.txt", "beta.py", ".hidden"):
+            (tmp_path / name).write_text("")
+        (tmp_path / "alps").mkdir()
+        (tmp_path / "alps" / "peak.md").write_text("")
+        return tmp_path
+
+    @staticmethod
+    def _complete(completer: InlinePathCompleter, text: str) -> list[str]:
+        return [c.text for c in completer.get_completions(Document(text), None)]
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("see ./al", ["./alpha.txt", "./alps/"]),
+            ("./", ["./alpha.txt", "./alps/", "./beta.py"]),
+            ("./.", ["./.hidden"]),
+            ("./alps/", ["./alps/peak.md"]),
+            ("alps/p", ["alps/peak.md"]),
+            ("./zzz", []),
+            ("al", []),
+            ("./missing/", []),
+        ],
+    )
+    def test_relative(self, root: Path, text: str, expected: list[str]) -> None:
+        """Test completion relative to the working directory."""
+        assert self._complete(InlinePathCompleter(str(root)), text) == expected
+
+    def test_parent_dir(self, root: Path) -> None:
+        """Test that ../ paths resolve against the working directory's parent."""
+        completer = InlinePathCompleter(str(root / "alps"))
+        assert self._complete(completer, "../al") == ["../alpha.txt", "../alps/"]
+
+    def test_absolute(self, root: Path) -> None:
+        """Test that absolute paths keep the typed prefix."""
+        completer = InlinePathCompleter(str(root / "alps"))
+        assert self._complete(completer, f"{root}/be") == [f"{root}/beta.py"]
+
+    def test_home(self, root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that ~/ paths are completed from the home directory."""
+        monkeypatch.setenv("HOME", str(root))
+        completer = InlinePathCompleter(str(root / "alps"))
+        assert self._complete(completer, "~/al") == ["~/alpha.txt", "~/alps/"]
+        assert self._complete(completer, "~/") == ["~/alpha.txt", "~/alps/", "~/beta.py"]
+
+    def test_completion_metadata(self, root: Path) -> None:
+        """Test that directories display with a slash and a dir label."""
+        completer = InlinePathCompleter(str(root))
+        [completion_] = completer.get_completions(Document("x ./alps"), None)
+        assert completion_.start_position == -len("./alps")
+        assert completion_.display_text == "alps/"
+        assert completion_.display_meta_text == "dir"
+
+    def test_capped(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that at most MAX_PATH_COMPLETIONS completions are offered."""
+        monkeypatch.setattr(completion, "MAX_PATH_COMPLETIONS", 3)
+        for i in range(5):
+            (tmp_path / f"f{i}").write_text("")
+        completer = InlinePathCompleter(str(tmp_path))
+        assert self._complete(completer, "./f") == ["./f0", "./f1", "./f2"]
+
+
+class TestListDir:
+    """Tests for _list_dir caching."""
+
+    def test_new_mtime_relists(self, tmp_path: Path) -> None:
+        """Test that a changed directory mtime gives a fresh listing."""
+        (tmp_path / "a").write_text("")
+        old_mtime = os.stat(tmp_path).st_mtime_ns
+        assert _list_dir(str(tmp_path), old_mtime) == (("a", False),)
+
+        (tmp_path / "b").mkdir()
+        os.utime(tmp_path, ns=(old_mtime, old_mtime + 1_000_000_000))
+        new_mtime = os.stat(tmp_path).st_mtime_ns
+        assert new_mtime != old_mtime
+
+        # The old key is still served from the cache; the new one relists
+        assert _list_dir(str(tmp_path), old_mtime) == (("a", False),)
+        assert _list_dir(str(tmp_path), new_mtime) == (("a", False), ("b", True))
@@ -0,0 +1,125 @@
+"""Tests for conversation storage."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ro_agent.core import conversations
+from ro_agent.core.conversations import META_SUFFIX, ConversationStore
+
+HISTORY: list[dict[str, Any]] = [
+    {"role": "user", "content": "Why did the nightly job fail? ünïcödé 日本語"},
+    {
+        "role": "assistant",
+        "content": None,
+        "tool_calls": [
+            {
+                "id": "call_1",
+                "type": "function",
+                "function": {"name": "shell", "arguments": '{"command":"tail log"}'},
+            }
+        ],
+    },
+    {"role": "tool", "tool_call_id": "call_1", "content": "OOM killed"},
+    {"role": "assistant", "content": "It ran out of memory."},
+]
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns the same instant."""
+
+    @classmethod
+    def now(cls, tz: Any = None) -> "_FrozenDatetime":
+        return cls(2025, 1, 2, 3, 4, 5)
+
+
+def _save(store: ConversationStore, **kwargs: Any) -> Path:
+    """Save HISTORY with fixed model and token counts."""
+    return store.save(
+        model="gpt-test",
+        system_prompt="You are helpful.",
+        history=HISTORY,
+        input_tokens=100,
+        output_tokens=20,
+        started=datetime(2025, 1, 2, 3, 0, 0),
+        **kwargs,
+    )
+
+
+class TestConversationStore:
+    """Tests for ConversationStore."""
+
+    @pytest.fixture(params=["orjson", "json"])
+    def store(
+        self, request: pytest.FixtureRequest, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> ConversationStore:
+        """Create a store using orjson, or the stdlib json fallback."""
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(conversations, "orjson", None)
+        return ConversationStore(tmp_path)
+
+    def test_round_trip(self, store: ConversationStore) -> None:
+        """Test that a saved conversation loads back unchanged."""
+        path = _save(store)
+        loaded = store.load(path.stem)
+        assert loaded is not None
+        assert loaded.history == HISTORY
+        assert loaded.system_prompt == "You are helpful."
+        assert (loaded.model, loaded.input_tokens, loaded.output_tokens) == ("gpt-test", 100, 20)
+        assert loaded.started == "2025-01-02T03:00:00"
+        # Files stay human-readable, with non-ASCII text unescaped
+        text = path.read_text(encoding="utf-8")
+        assert '\n  "id"' in text
+        assert "日本語" in text
+
+    def test_same_second_ids_are_distinct(
+        self, store: ConversationStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that saves within the same second get _N suffixed ids."""
+        monkeypatch.setattr(conversations, "datetime", _FrozenDatetime)
+        ids = [_save(store).stem for _ in range(3)]
+        assert ids == ["2025-01-02_03-04-05", "2025-01-02_03-04-05_2", "2025-01-02_03-04-05_3"]
+        assert {m.id for m in store.list_conversations()} == set(ids)
+
+    def test_listing_uses_sidecar(self, store: ConversationStore) -> None:
+        """Test that listing reads metadata from the sidecar."""
+        path = _save(store)
+        [meta] = store.list_conversations()
+        assert meta.id == path.stem
+        assert meta.message_count == len(HISTORY)
+        assert meta.first_user_message == HISTORY[0]["content"]
+
+        # The full history isn't parsed when the sidecar is present
+        path.write_text("not json", encoding="utf-8")
+        assert store.list_conversations() == [meta]
+
+    def test_listing_backfills_missing_sidecar(self, store: ConversationStore) -> None:
+        """Test that conversations saved without a sidecar are listed and backfilled."""
+        path = _save(store)
+        meta_path = path.with_name(path.stem + META_SUFFIX)
+        expected = json.loads(meta_path.read_text(encoding="utf-8"))
+        meta_path.unlink()
+
+        [meta] = store.list_conversations()
+        assert meta.id == path.stem
+        assert meta.message_count == len(HISTORY)
+        assert meta.input_tokens == 100
+        assert json.loads(meta_path.read_text(encoding="utf-8")) == expected
+
+    def test_listing_skips_unreadable(self, store: ConversationStore) -> None:
+        """Test that a corrupt conversation without a sidecar is skipped."""
+        (store.conversations_dir / "broken.json").write_text("{", encoding="utf-8")
+        path = _save(store)
+        assert [m.id for m in store.list_conversations()] == [path.stem]
+
+    def test_get_latest_id(self, store: ConversationStore) -> None:
+        """Test the latest id with and without saved conversations."""
+        assert store.get_latest_id() is None
+        path = _save(store, conversation_id="resumed")
+        assert path.stem == "resumed"
+        assert store.get_latest_id() == "resumed"
@@ -0,0 +1,94 @@
+"""Tests for the model client's tool-call argument handling and client sharing."""
+
+import json
+
+import pytest
+
+from ro_agent.client import model
+from ro_agent.client.model import ModelClient, _parse_tool_arguments
+
+
+class TestParseToolArguments:
+    """Tests for _parse_tool_arguments."""
+
+    def test_empty(self) -> None:
+        """Test that missing arguments parse to an empty dict."""
+        assert _parse_tool_arguments("") == {}
+        assert _parse_tool_arguments(None) == {}
+        assert _parse_tool_arguments("{}") == {}
+
+    def test_complete(self) -> None:
+        """Test that complete JSON is parsed as-is."""
+        assert _parse_tool_arguments('{"path": "/tmp/x", "limit": 5}') == {
+            "path": "/tmp/x",
+            "limit": 5,
+        }
+
+    def test_non_object(self) -> None:
+        """Test that non-object JSON is rejected."""
+        assert _parse_tool_arguments("[1, 2]") == {}
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ('{"path": "/tmp/x", "limit": 5', {"path": "/tmp/x"}),
+            ('{"path": "/tmp/x", "lim', {"path": "/tmp/x"}),
+            ('{"path": "/tmp/x",', {"path": "/tmp/x"}),
+            ('{"path": "/tmp/x", "limit":', {"path": "/tmp/x"}),
+            ('{"path": "/tmp/x"', {"path": "/tmp/x"}),
+            ('{"a": {"b": "c"}, "d": ["e", "f', {"a": {"b": "c"}}),
+            ('{"paths": ["a", "b"]', {"paths": ["a", "b"]}),
+            ('{"paths": ["a", "b', {}),
+            ('{"paths": [', {}),
+            ('{"path": "/tmp/x", "opts": {"a": 1', {"path": "/tmp/x"}),
+        ],
+    )
+    def test_truncated_keeps_complete_fields(
+        self, raw: str, expected: dict[str, object]
+    ) -> None:
+        """Test that truncated arguments keep only fully received fields."""
+        assert _parse_tool_arguments(raw) == expected
+
+    def test_truncated_value_is_dropped(self) -> None:
+        """Test that a partially received value is never used."""
+        full = {"command": "rm -rf /tmp/build/output", "paths": ["a", "b"], "n": 12}
+        raw = json.dumps(full)
+        for cut in range(len(raw)):
+            args = _parse_tool_arguments(raw[:cut])
+            for key, value in args.items():
+                assert value == full[key]
+
+
+class TestSharedClient:
+    """Tests for sharing AsyncOpenAI clients between ModelClients."""
+
+    @pytest.mark.asyncio
+    async def test_same_loop_shares_client(self) -> None:
+        """Test that two ModelClients built in one loop share one client."""
+        a = ModelClient(api_key="x", base_url="http://localhost:1/v1")
+        b = ModelClient(api_key="x", base_url="http://localhost:1/v1")
+        client = a._openai()
+        assert b._openai() is client
+
+        await a.aclose()
+        assert not client.is_closed()
+        await b.aclose()
+        assert client.is_closed()
+        assert not model._SHARED_CLIENTS
+
+    @pytest.mark.asyncio
+    async def test_different_settings_use_separate_clients(self) -> None:
+        """Test that clients are only shared between identical settings."""
+        a = ModelClient(api_key="x", base_url="http://localhost:1/v1")
+        b = ModelClient(api_key="y", base_url="http://localhost:1/v1")
+        try:
+            assert a._openai() is not b._openai()
+        finally:
+            await a.aclose()
+            await b.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_without_use(self) -> None:
+        """Test that closing a client that never made a request is a no-op."""
+        await ModelClient(api_key="x").aclose()
+        assert not model._SHARED_CLIENTS
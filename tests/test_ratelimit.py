@@ -0,0 +1,137 @@
+"""Tests for client-side rate-limit pacing."""
+
+import pytest
+
+from ro_agent.client import ratelimit
+from ro_agent.client.ratelimit import RateLimiter, _Budget, _parse_duration
+
+
+class TestParseDuration:
+    """Tests for _parse_duration."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("6s", 6.0),
+            ("250ms", 0.25),
+            ("1m30s", 90.0),
+            ("6m0s", 360.0),
+            ("1h2m3.5s", 3723.5),
+            ("0.5s", 0.5),
+        ],
+    )
+    def test_durations(self, value: str, expected: float) -> None:
+        """Test that reset durations are converted to seconds."""
+        assert _parse_duration(value) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("value", ["", "soon", "12"])
+    def test_unparseable(self, value: str) -> None:
+        """Test that values without a unit parse to None."""
+        assert _parse_duration(value) is None
+
+
+class TestBudget:
+    """Tests for _Budget."""
+
+    def test_unknown_budget_never_waits(self) -> None:
+        """Test that a budget no response has reported never delays."""
+        assert _Budget().delay(10**6, now=0.0) == 0.0
+
+    def test_within_budget(self) -> None:
+        """Test that a request fitting the remaining budget doesn't wait."""
+        budget = _Budget()
+        budget.update("100", "10s", now=0.0)
+        assert budget.delay(100, now=1.0) == 0.0
+
+    def test_exhausted_waits_for_reset(self) -> None:
+        """Test that an exhausted budget waits until the window resets."""
+        budget = _Budget()
+        budget.update("100", "10s", now=0.0)
+        assert budget.delay(101, now=4.0) == pytest.approx(6.0)
+
+    def test_consume_exhausts(self) -> None:
+        """Test that consumed amounts count against the budget."""
+        budget = _Budget()
+        budget.update("1", "1m30s", now=0.0)
+        budget.consume(1, now=0.0)
+        assert budget.delay(1, now=30.0) == pytest.approx(60.0)
+
+    def test_window_rollover(self) -> None:
+        """Test that nothing waits once the window has reset."""
+        budget = _Budget()
+        budget.update("0", "250ms", now=0.0)
+        assert budget.delay(1, now=0.25) == 0.0
+        budget.consume(1, now=0.25)
+        assert budget.remaining is None
+
+    @pytest.mark.parametrize(
+        ("remaining", "reset"), [(None, "1s"), ("5", None), ("x", "1s"), ("5", "?")]
+    )
+    def test_bad_headers_ignored(self, remaining: str | None, reset: str | None) -> None:
+        """Test that missing or malformed header values leave the budget alone."""
+        budget = _Budget()
+        budget.update(remaining, reset, now=0.0)
+        assert budget.remaining is None
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter.acquire."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        """Freeze time.monotonic at 0 and record requested sleeps."""
+        sleeps: list[float] = []
+
+        async def sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr(ratelimit.time, "monotonic", lambda: 0.0)
+        monkeypatch.setattr(ratelimit.asyncio, "sleep", sleep)
+        return sleeps
+
+    @pytest.mark.asyncio
+    async def test_no_headers_no_wait(self, clock: list[float]) -> None:
+        """Test that providers without rate-limit headers are never delayed."""
+        limiter = RateLimiter()
+        limiter.update({})
+        await limiter.acquire(tokens=10**6)
+        assert clock == []
+        assert not limiter.tracks_tokens
+
+    @pytest.mark.asyncio
+    async def test_request_budget_exhausted(self, clock: list[float]) -> None:
+        """Test that running out of requests waits for the request window."""
+        limiter = RateLimiter()
+        limiter.update(
+            {"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "6s"}
+        )
+        await limiter.acquire()
+        assert clock == [pytest.approx(6.0)]
+
+    @pytest.mark.asyncio
+    async def test_token_budget_exhausted(self, clock: list[float]) -> None:
+        """Test that a request larger than the token budget waits for its window."""
+        limiter = RateLimiter()
+        limiter.update(
+            {
+                "x-ratelimit-remaining-requests": "10",
+                "x-ratelimit-reset-requests": "1s",
+                "x-ratelimit-remaining-tokens": "500",
+                "x-ratelimit-reset-tokens": "20s",
+            }
+        )
+        assert limiter.tracks_tokens
+        await limiter.acquire(tokens=400)
+        assert clock == []
+        await limiter.acquire(tokens=400)
+        assert clock == [pytest.approx(20.0)]
+
+    @pytest.mark.asyncio
+    async def test_wait_is_capped(self, clock: list[float]) -> None:
+        """Test that no single wait exceeds MAX_WAIT."""
+        limiter = RateLimiter()
+        limiter.update(
+            {"x-ratelimit-remaining-tokens": "0", "x-ratelimit-reset-tokens": "1h"}
+        )
+        await limiter.acquire(tokens=1)
+        assert clock == [RateLimiter.MAX_WAIT]
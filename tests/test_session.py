@@ -0,0 +1,132 @@
+"""Tests for the session's incremental token estimate."""
+
+from typing import Any
+
+import pytest
+
+from ro_agent.core.agent import COMPACT_KEEP_FIRST, COMPACT_KEEP_LAST, Agent
+from ro_agent.core.session import Session, ToolResult, _message_chars, _text_chars
+from ro_agent.tools.registry import ToolRegistry
+
+
+def _recount(session: Session) -> int:
+    """Estimate the session's tokens from scratch."""
+    chars = _text_chars(session.system_prompt)
+    chars += sum(_message_chars(m) for m in session.history)
+    return chars // 4
+
+
+def _user_messages(session: Session) -> list[str]:
+    """Collect the session's user messages from scratch."""
+    return [m["content"] for m in session.history if m["role"] == "user" and m.get("content")]
+
+
+def _assert_in_sync(session: Session) -> None:
+    """Assert the cached estimate and user messages match a full recount."""
+    assert session.estimate_tokens() == _recount(session)
+    assert session.get_user_messages() == _user_messages(session)
+
+
+def _populate(session: Session) -> None:
+    """Add one of each kind of message, checking the cache after each."""
+    session.add_user_message("list the files in /var/log")
+    _assert_in_sync(session)
+    session.add_assistant_tool_calls(
+        [
+            {
+                "id": "call_1",
+                "type": "function",
+                "function": {"name": "shell", "arguments": '{"command":"ls /var/log"}'},
+            }
+        ]
+    )
+    _assert_in_sync(session)
+    session.add_tool_results([ToolResult("call_1", "syslog\nauth.log\n" * 200)])
+    _assert_in_sync(session)
+    session.add_assistant_message("Two logs: syslog and auth.log, ünïcödé 日本語")
+    _assert_in_sync(session)
+
+
+class TestEstimateTokens:
+    """Tests for Session.estimate_tokens and get_user_messages caching."""
+
+    @pytest.fixture
+    def session(self) -> Session:
+        """Create a session with a short conversation."""
+        session = Session(system_prompt="You are a read-only research assistant.")
+        _populate(session)
+        return session
+
+    def test_add_messages(self, session: Session) -> None:
+        """Test that the estimate tracks each appended message."""
+        _populate(session)
+        _assert_in_sync(session)
+
+    @pytest.mark.parametrize("index", [0, 2, 3])
+    def test_set_message_content(self, session: Session, index: int) -> None:
+        """Test that replacing a message's content updates the estimate."""
+        _assert_in_sync(session)
+        session.set_message_content(index, "short")
+        _assert_in_sync(session)
+
+    def test_reassigned_history(self, session: Session) -> None:
+        """Test that assigning a new history list (as resume does) is recounted."""
+        _assert_in_sync(session)
+        other = Session(system_prompt="other")
+        other.add_user_message("a different conversation")
+        session.history = other.history.copy()
+        _assert_in_sync(session)
+        session.add_user_message("and a follow-up")
+        _assert_in_sync(session)
+
+    def test_replace_with_summary(self, session: Session) -> None:
+        """Test that compacting history into a summary resets the estimate."""
+        _assert_in_sync(session)
+        session.replace_with_summary("Summary of the work so far", ["recent request"])
+        _assert_in_sync(session)
+        _populate(session)
+        _assert_in_sync(session)
+
+    def test_trim_tool_results(self, session: Session) -> None:
+        """Test that the agent's tool-result trimming keeps the estimate exact."""
+        for _ in range(COMPACT_KEEP_FIRST + COMPACT_KEEP_LAST):
+            _populate(session)
+        before = session.estimate_tokens()
+        agent = Agent(session, ToolRegistry(), client=object())  # type: ignore[arg-type]
+        assert agent._trim_tool_results() > 0
+        _assert_in_sync(session)
+        assert session.estimate_tokens() < before
+
+    def test_clear(self, session: Session) -> None:
+        """Test that clearing history resets the estimate."""
+        _assert_in_sync(session)
+        session.clear()
+        _assert_in_sync(session)
+        assert session.estimate_tokens() == _text_chars(session.system_prompt) // 4
+
+    def test_system_prompt_change(self, session: Session) -> None:
+        """Test that a new system prompt is counted."""
+        _assert_in_sync(session)
+        session.system_prompt = "x" * 400
+        _assert_in_sync(session)
+
+
+class TestTextChars:
+    """Tests for _text_chars."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("", 0), ("hello", 5), ("é", 2), ("日本", 8)],
+    )
+    def test_weights(self, text: str, expected: int) -> None:
+        """Test that non-ASCII characters are weighted by their extra bytes."""
+        assert _text_chars(text) == expected
+
+    def test_message_chars_counts_tool_calls(self) -> None:
+        """Test that tool-call names and arguments count toward a message."""
+        message: dict[str, Any] = {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{"function": {"name": "grep", "arguments": '{"p":"x"}'}}],
+        }
+        assert _message_chars(message) == len("grep") + len('{"p":"x"}')